@@ -1,7 +1,10 @@
 from abc import ABC
 import argparse
 from ast import literal_eval
+from functools import lru_cache
+from numbers import Complex, Integral, Number, Real
 from pathlib import Path
+import re
 import textwrap
 
 from matej.collections import ensure_iterable
@@ -22,8 +25,8 @@ class ArgParser(argparse.ArgumentParser):
 
 	def __init__(self, *args, **kw):
 		""" Initialise the parser. See the documentation of :class:`argparse.ArgumentParser` for more information. """
-		if 'formatter_class' not in kw:
-			kw['formatter_class'] = HelpfulFormatter
+		# Both of these only store the class; argparse instantiates the formatter when help is formatted and the action when it's used
+		kw.setdefault('formatter_class', HelpfulFormatter)
 		super().__init__(*args, **kw)
 		self.register('action', 'store_dict', StoreDictPairsAction)
 
@@ -95,6 +98,8 @@ class Arg(ABC):
 	Instances of this class's subclasses can be added to an arbitrary :class:`argparse.ArgumentParser` instance
 	using the :meth:`add_to_ap` method,	although certain restrictions apply, as specified in the subclasses' docs.
 	"""
+	__slots__ = ('flags', 'kw')
+
 	def __init__(self, *flags, **kw):
 		"""
 		Initialise the argument.
@@ -111,7 +116,7 @@ class Arg(ABC):
 
 	def add_to_ap(self, parser, **kw):
 		""" Add this argument to the given parser. """
-		kw = self.kw | kw
+		kw = self.kw | kw if kw else self.kw  # Unpacked into add_argument, so self.kw is never mutated
 		if not self.flags and 'dest' not in kw:
 			raise ValueError("You must provide a destination name for flagless arguments")
 		return parser.add_argument(*self.flags, **kw)
@@ -119,6 +124,8 @@ class Arg(ABC):
 
 class NullableArg(Arg, ABC):
 	""" Base class for arguments that may allow `None` values. """
+	__slots__ = ('nullable', 'null_phrases', '_max_null_len')
+
 	def __init__(self, *flags, nullable=None, null_phrases=('', 'none'), **kw):
 		"""
 		Initialise the argument.
@@ -131,7 +138,8 @@ class NullableArg(Arg, ABC):
 			Phrases that will be interpreted as `None` if the argument is nullable (case-insensitive).
 		"""
 		self.nullable = nullable
-		self.null_phrases = null_phrases
+		self.null_phrases = frozenset(phrase.lower() for phrase in null_phrases)
+		self._max_null_len = max(map(len, self.null_phrases), default=-1)
 		if nullable is None:
 			self.nullable = kw.get('default') is None
 		if 'default' in kw and kw['default'] is None:
@@ -147,21 +155,30 @@ class NullableArg(Arg, ABC):
 		cls.type = type
 
 	def _type(self, s):
-		if self.nullable and (s is None or s.strip().lower() in self.null_phrases):
-			return None
+		if self.nullable:
+			if s is None:
+				return None
+			# Values longer than any null phrase can't be one, so they're not lowercased
+			stripped = s.strip()
+			if len(stripped) <= self._max_null_len and stripped.lower() in self.null_phrases:
+				return None
 		return self.type(s)
 
 
 class StrArg(NullableArg):
 	""" String argument. By default this argument is optional and accepts a single string as its value. """
+	__slots__ = ()
 
 
 class PathArg(NullableArg, type=Path):
 	""" Path argument. By default this argument is optional and accepts a single path as its value. """
+	__slots__ = ()
 
 
 class BoolArg(Arg):
 	""" Boolean argument. """
+	__slots__ = ('short_flags', 'long_flags', 'dest', 'default', 'short_help', 'yes_help', 'no_help')
+
 	def __init__(self, *flags, default=False, help="", negative_help=None, **kw):
 		"""
 		Initialise the argument.
@@ -181,8 +198,13 @@ class BoolArg(Arg):
 		For other parameters, see the documentation of :meth:`Arg.__init__`.
 		"""
 		super().__init__(*flags, **kw)
-		self.short_flags = [flag for flag in flags if flag[0] == '-' and flag[1] != '-']
-		self.long_flags = [flag for flag in flags if flag[:2] == '--']
+		self.short_flags = []
+		self.long_flags = []
+		for flag in flags:
+			if flag.startswith('--'):
+				self.long_flags.append(flag)
+			elif flag.startswith('-'):
+				self.short_flags.append(flag)
 		self.dest = kw.get('dest', (self.long_flags[0] if self.long_flags else flags[0]).strip('-').replace('-', '_'))
 		self.default = default
 
@@ -207,7 +229,7 @@ class BoolArg(Arg):
 				- store `False` into the destination if `'False'` or `'No'` is passed as an argument,
 				- toggle the default value if no argument is passed.
 		"""
-		kw = self.kw | kw
+		kw = self.kw | kw if kw else self.kw
 		group = parser.add_mutually_exclusive_group()
 		result = group.add_argument(*self.short_flags, dest=self.dest, nargs='?', default=self.default, const=not self.default, type=self._str_to_bool, help=self.short_help, **kw)
 		group.add_argument(*self.long_flags, dest=self.dest, action='store_true', help=self.yes_help, **kw)
@@ -216,17 +238,24 @@ class BoolArg(Arg):
 
 	@staticmethod
 	def _no_f(arg):
-		return '--no-' + arg.strip('-')
+		return '--no-' + arg[2:]  # Only called with long flags
 
 	@staticmethod
 	def _str_to_bool(s):
 		return s.lower() in {'true', 'yes', 't', 'y', '1'}
 
 
+def _is_real(x):
+	# Decimal is only registered as a Number, so numbers.Real alone would exclude it
+	return isinstance(x, Real) or isinstance(x, Number) and not isinstance(x, Complex)
+
+
 #TODO: Make it possible to pass the choice descriptions as values too?
 #TODO: Make nullable
 class ChoiceArg(Arg):
 	""" Choice argument. """
+	__slots__ = ('choices', 'choice_descriptions', 'type')
+
 	def __init__(self, choices, *flags, choice_descriptions=(), type=None, help="", **kw):
 		"""
 		Initialise the argument.
@@ -253,21 +282,21 @@ class ChoiceArg(Arg):
 		self.type = type
 
 		if self.type is None:
-			try:
-				self.type = int if all(int(x) == x for x in choices) else float
-			except ValueError as e:
-				if all(isinstance(x, str) for x in choices):
-					self.type = str
-				else:
-					raise TypeError("Could not infer the type of the choices. Please pass the `type` argument.") from e
+			if all(_is_real(x) for x in choices):
+				self.type = int if all(isinstance(x, Integral) or int(x) == x for x in choices) else float
+			elif all(isinstance(x, str) for x in choices):
+				self.type = str
+			else:
+				raise TypeError("Could not infer the type of the choices. Please pass the `type` argument.")
 		if choice_descriptions:
 			longest = max(len(str(choice)) for choice in choices)
-			help += "\n"
+			lines = [help]
 			for choice, description in zip(choices, choice_descriptions):
-				help += f"\t{choice:>{longest}}: {description}"
+				line = f"\t{choice:>{longest}}: {description}"
 				if 'default' in kw and choice == kw['default']:
-					help += " <default>"
-				help += "\n"
+					line += " <default>"
+				lines.append(line)
+			help = "\n".join(lines) + "\n"
 		else:
 			help += "{default}"
 
@@ -279,6 +308,8 @@ class ChoiceArg(Arg):
 #TODO: Make nullable (?)
 class NumberArg(Arg):
 	""" Number argument. """
+	__slots__ = ('type',)
+
 	def __init__(self, *flags, min=None, max=None, range=None, type=None, help="", **kw):
 		"""
 		Initialise the argument.
@@ -315,13 +346,17 @@ class NumberArg(Arg):
 		if self.type is None:
 			self.type = int if min is not None and isinstance(min, int) and (max is None or isinstance(max, int)) or max is not None and isinstance(max, int) and min is None else float
 
-		def _type(x):
-			x = self.type(x)
-			if min is not None and x < min:
-				raise argparse.ArgumentTypeError(f"{flags[0]} should be least {min}")
-			if max is not None and x > max:
-				raise argparse.ArgumentTypeError(f"{flags[0]} should be at most {max}")
-			return x
+		convert = self.type
+		if min is None and max is None:
+			_type = convert  # Nothing to check, so values are only converted
+		else:
+			def _type(x):
+				x = convert(x)
+				if min is not None and x < min:
+					raise argparse.ArgumentTypeError(f"{flags[0]} should be at least {min}")
+				if max is not None and x > max:
+					raise argparse.ArgumentTypeError(f"{flags[0]} should be at most {max}")
+				return x
 
 		if min is None and max is not None:
 			help += f" [{{metavar}} <= {max}]"
@@ -359,11 +394,21 @@ class HelpfulFormatter(argparse.RawTextHelpFormatter):
 				continue
 
 			# wrap the line's help segment which preserves new lines but ensures line lengths are honored
-			new_text.extend(textwrap.wrap(line, width))
+			new_text.extend(_wrap(line, width))
 
 		return new_text
 
 
+# Help is re-wrapped for every action each time it's formatted, so the (pure) wrapping is cached
+@lru_cache(maxsize=256)
+def _wrap(line, width):
+	return tuple(textwrap.wrap(line, width))
+
+
+# Values that can't start like a literal (number, container, possibly prefixed string, keyword or set()) are plain strings, so they don't need to be parsed
+_LITERAL_START = re.compile(r'[ \t]*(?:[0-9+\-.([{\'"]|[bBrRuU]{1,2}[\'"]|(?:True|False|None)\b|set\s*\()')
+
+
 class StoreDictPairsAction(argparse.Action):
 	""" Custom action to store key-value pairs in a dictionary. """
 	def __init__(self, option_strings, dest, nargs=None, *args, metavar="KEY VALUE", **kw):
@@ -376,80 +421,28 @@ class StoreDictPairsAction(argparse.Action):
 		unpacked = []
 		for value in values:
 			if '=' in value:
-				unpacked.extend(value.split('='))
+				# Only split on the first '=', so values can contain '=' themselves
+				key, _, value = value.partition('=')
+				unpacked += key, value
 			else:
 				unpacked.append(value)
 		if len(unpacked) % 2 != 0:
 			raise ValueError("Each key should have a corresponding value")
 		for key, value in zip(unpacked[0::2], unpacked[1::2]):
-			try:
-				d[key] = literal_eval(value)
-			except ValueError:
-				d[key] = value
+			if _LITERAL_START.match(value):
+				try:
+					value = literal_eval(value)
+				except (ValueError, SyntaxError):
+					pass
+			d[key] = value
 		setattr(namespace, self.dest, d)  # necessary if new dictionary was created
 
 
 class ListOrSingleAction(argparse.Action):
 	""" Custom action that converts a list of length 1 into a single value for arguments that can receive multiple values. """
 	def __call__(self, parser, namespace, values, option_string=None):
-		values = ensure_iterable(values, str)
+		if not isinstance(values, list):  # Multi-value nargs always give a list, so this is only needed for single values
+			values = ensure_iterable(values, str)
 		if len(values) == 1:
 			values = values[0]
 		setattr(namespace, self.dest, values)
-
-
-#TODO: Move this shit to tests like a proper Python developer
-if __name__ == '__main__':
-	ap = ArgParser()
-
-	# Path args
-	ap.add_path_arg('-p', '--path-arg', default='', help="first path arg")
-	ap.add_path_arg(dest='second_path_arg', default='', help="second path arg")
-	assert ap.parse_args(['asdf']).second_path_arg == Path('asdf')
-	assert ap.parse_args(['-p', 'qwer']).path_arg == Path('qwer')
-	_namespace = ap.parse_args(['asdf', '-p', 'qwer'])
-	assert _namespace.path_arg == Path('qwer')
-	assert _namespace.second_path_arg == Path('asdf')
-
-	# Bool args
-	ap.add_bool_arg('-t', '--true-arg', default=True, help="default true bool arg")
-	ap.add_bool_arg('-f', '--false-arg', default=False, help="default false bool arg")
-	assert ap.parse_args(['-t', 'True']).true_arg is True
-	assert ap.parse_args(['-t', 'False']).true_arg is False
-	assert ap.parse_args(['-t']).true_arg is False
-	assert ap.parse_args(['--true-arg']).true_arg is True
-	assert ap.parse_args(['--no-true-arg']).true_arg is False
-	assert ap.parse_args(['-f', 'False']).false_arg is False
-	assert ap.parse_args(['-f', 'True']).false_arg is True
-	assert ap.parse_args(['-f']).false_arg is True
-	assert ap.parse_args(['--false-arg']).false_arg is True
-	assert ap.parse_args(['--no-false-arg']).false_arg is False
-	# _namespace = ap.parse_args(['-tf'])  # This one doesn't work
-	# assert _namespace.true_arg is False
-	# assert _namespace.false_arg is True
-
-	# Choice args
-	ap.add_choice_arg((1, 2, 3), '-c', '--choice-arg', default=1, help="default 1 choice arg")
-	ap.add_choice_arg(('b2t', 't2b'), '--method', choice_descriptions=("Bottom-to-top", "Top-to-bottom"), help="no default choice arg")
-	ap.add_choice_arg(('df', 'bf'), '--search', default='df', choice_descriptions=("Depth-first", "Breadth-first"), help="default depth-first choice arg")
-	assert ap.parse_args([]).choice_arg == 1
-	assert ap.parse_args(['-c', '2']).choice_arg == 2
-	# ap.parse_args(['-c', '4'])  # should raise error
-	assert ap.parse_args(['--method', 't2b']).method == 't2b'
-	assert ap.parse_args([]).method is None
-
-	# Number args
-	ap.add_number_arg('-m', '--number-arg', range=(0, 100.), nargs='+', help="number arg")
-	ap.add_number_arg('-n', '--number-arg2', min=0, default=40, help="default 40 number arg")
-	_namespace = ap.parse_args([])
-	assert _namespace.number_arg is None
-	assert _namespace.number_arg2 == 40
-	assert ap.parse_args(['-m', '50']).number_arg == 50.
-	assert ap.parse_args(['-n', '610']).number_arg2 == 610
-	assert ap.parse_args(['-m', '50.5', '60', '70']).number_arg == [50.5, 60., 70.]
-	# ap.parse_args(['-m', '101'])  # should raise error
-	# ap.parse_args(['-m', '50', '101'])  # should raise error
-	# ap.parse_args(['-n', '-1'])  # should raise error
-
-	# Print help
-	ap.parse_args(['-h'])
\ No newline at end of file
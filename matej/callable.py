@@ -10,10 +10,21 @@ class partial(ft.partial):
 	Credit to https://stackoverflow.com/a/66274908/5769814.
 	"""
 
+	def __new__(cls, func, /, *args, **keywords):
+		self = super().__new__(cls, func, *args, **keywords)
+		# Checked once, so partials without placeholders can just prepend their arguments when called
+		self._has_placeholders = any(arg is ... for arg in self.args)
+		return self
+
 	def __call__(self, *args, **kw):
+		if kw:
+			kw = self.keywords | kw
+		else:
+			kw = self.keywords
+		if not self._has_placeholders:
+			return self.func(*self.args, *args, **kw)
 		iargs = iter(args)
 		args = (next(iargs) if arg is ... else arg for arg in self.args)
-		kw = self.keywords | kw
 		return self.func(*args, *iargs, **kw)
 
 
@@ -24,20 +35,32 @@ class partialmethod(ft.partialmethod):
 	"""
 
 	def _make_unbound_method(self):
-		def _method(cls_or_self, /, *args, **kw):
-			iargs = iter(args)
-			args = (next(iargs) if arg is ... else arg for arg in self.args)
-			kw = self.keywords | kw
-			return self.func(cls_or_self, *args, *iargs, **kw)
+		if any(arg is ... for arg in self.args):
+			def _method(cls_or_self, /, *args, **kw):
+				iargs = iter(args)
+				args = (next(iargs) if arg is ... else arg for arg in self.args)
+				kw = self.keywords | kw
+				return self.func(cls_or_self, *args, *iargs, **kw)
+		else:
+			def _method(cls_or_self, /, *args, **kw):
+				return self.func(cls_or_self, *self.args, *args, **(self.keywords | kw if kw else self.keywords))
 		_method.__dict__ = super()._make_unbound_method().__dict__
 		return _method
 
-	def __get__(self, *args, **kw):
-		old = ft.partial
-		ft.partial = partial
-		result = super().__get__(*args, **kw)
-		ft.partial = old
-		return result
+	# Same as ft.partialmethod.__get__, but builds this module's partial directly instead of patching ft.partial
+	def __get__(self, obj, cls=None):
+		get = getattr(self.func, '__get__', None)
+		# Wrapped partials take the unbound-method path, like in ft.partialmethod since Python 3.13 (where partial gained a __get__)
+		if get is not None and not isinstance(self.func, ft.partial):
+			new_func = get(obj, cls)
+			if new_func is not self.func:
+				result = partial(new_func, *self.args, **self.keywords)
+				try:
+					result.__self__ = new_func.__self__
+				except AttributeError:
+					pass
+				return result
+		return self._make_unbound_method().__get__(obj, cls)
 
 
 def compose(*functions):
@@ -45,9 +68,28 @@ def compose(*functions):
 	Compose arbitrary number of functions into one. I.e. `compose(f, g, h)(x, y) == f(g(h(x, y)))`.
 
 	All functions, aside from the last one (`h` in the above example), must take exactly one argument.
+	Composing no functions gives the identity function.
 	"""
 
-	return ft.reduce(lambda f, g: lambda *args, **kwargs: f(g(*args, **kwargs)), functions)
+	if not functions:
+		return lambda x: x
+	if len(functions) == 1:
+		return functions[0]
+	if len(functions) == 2:
+		f, g = functions
+		return lambda *args, **kwargs: f(g(*args, **kwargs))
+
+	# A single closure looping over the functions, instead of a chain of nested lambdas (one frame per function)
+	*rest, last = functions
+	rest.reverse()
+	rest = tuple(rest)
+
+	def composed(*args, **kwargs):
+		result = last(*args, **kwargs)
+		for f in rest:
+			result = f(result)
+		return result
+	return composed
 
 
 # Call as make_module_callable(__name__, function_to_call) at the end of the module definition
@@ -60,9 +102,7 @@ def make_module_callable(module_name, f):
 
 def varargs(f):
 	""" Decorator that lets a function with varargs also accept a single iterable argument. """
-	from inspect import signature
-	from matej.collections import is_iterable
-	args = signature(f).parameters
+	from matej.collections import is_iterable  # Imported here because matej.collections imports this module
 
 	@ft.wraps(f)
 	def wrapper(*args, **kwargs):
@@ -70,20 +110,3 @@ def varargs(f):
 			return f(*args[0], **kwargs)
 		return f(*args, **kwargs)
 	return wrapper
-
-
-if __name__ == '__main__':
-	@varargs
-	def test(*arglist, kwarg=None):
-		print(arglist, kwarg)
-
-	test([1, 2, 3])
-	test(1, 2, 3)
-
-	@varargs
-	def test2(arg, *arglist, kwarg=None):
-		print(arg, arglist, kwarg)
-
-	test2([1, 2, 3], [4, 5, 6])
-	test2(1, 2, 3, 4, 5, 6)
-	test2([1, 2, 3])
@@ -1,11 +1,13 @@
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Iterator, MutableMapping
+from collections.abc import Iterable, Mapping, Iterator, MutableMapping, Sequence
 import itertools as it
 from functools import reduce
 import operator as op
 import random
 from typing import List, Dict, Set, Tuple, Callable
 
+import numpy as np
+
 from matej.callable import compose
 from matej.math import ZERO, ONE
 
@@ -32,8 +34,7 @@ def is_iterable(x, noniterable_types=None):
 	if noniterable_types not in (None, False) and isinstance(x, noniterable_types):
 		return False
 	try:
-		for _ in x:
-			break
+		iter(x)  # Don't start iterating, so that iterators (e.g. generators) aren't consumed
 		return True
 	except Exception:  #pylint: disable=broad-except  # Can't just catch TypeError because other exceptions can be raised in some cases
 		return False
@@ -49,18 +50,44 @@ def shuffle(l):
 
 
 def shuffled(l):
+	t = type(l)
+	if t is list:
+		return random.sample(l, len(l))
+	if t is tuple:
+		return tuple(random.sample(l, len(l)))
+
+	# random.sample only accepts sequences, so anything else (e.g. a set) is copied into a list first
+	if not isinstance(l, Sequence):
+		l = list(l)
 	new_l = random.sample(l, len(l))
 	try:
-		return type(l)(new_l)
+		return t(new_l)
 	except TypeError:
 		return new_l
 
 
+# Exact built-in types for which flatten's decision depends only on the flags, keyed by (flatten_strings, flatten_dicts)
+# Maps to (types to flatten, types to yield as they are); anything else goes through the general check
+_FLATTEN_TYPES = {
+	(strings, dicts): (
+		frozenset({list, tuple, set, frozenset, range, *((dict,) if dicts else ())}),
+		frozenset({int, float, complex, bool, type(None), *(() if strings else (str, bytes)), *(() if dicts else (dict,))}),
+	)
+	for strings in (False, True) for dicts in (False, True)
+}
+
+
 def flatten(l, flatten_strings=False, flatten_dicts=True, flatten_generators=True):
+	flat_types, leaf_types = _FLATTEN_TYPES[bool(flatten_strings), bool(flatten_dicts)]
 	for x in l:
-		if (
+		t = type(x)
+		if t in flat_types:
+			yield from flatten(x, flatten_strings, flatten_dicts, flatten_generators)
+		elif t in leaf_types:
+			yield x
+		elif (
 			is_iterable(x)
-		    and ((flatten_strings and len(x) > 1) or not isinstance(x, (str, bytes)))
+		    and (not isinstance(x, (str, bytes)) or (flatten_strings and len(x) > 1))
 		    and (flatten_dicts or not isinstance(x, Mapping))
 		    and (flatten_generators or not isinstance(x, Iterator))
 		):
@@ -80,9 +107,15 @@ class DotDict(dict):
 
 	def __init__(self, *args, **kwargs):
 		super().__init__(*args, **kwargs)
-		for key, val in self.items():
-			if isinstance(val, Mapping):
-				self[key] = DotDict(val)
+		# Wrap nested mappings iteratively, so deep nesting doesn't need a Python frame (and an __init__ call) per level
+		stack = [self]
+		while stack:
+			d = stack.pop()
+			for key, val in d.items():
+				if isinstance(val, Mapping):
+					d[key] = nested = DotDict.__new__(DotDict)
+					dict.__init__(nested, val)
+					stack.append(nested)
 
 	def __delattr__(self, name):
 		try:
@@ -110,7 +143,8 @@ class BiDict(MutableMapping):
 		return key in self.dict or key in self.inverse
 
 	def __getitem__(self, key):
-		return self.dict[key] if key in self.dict else self.inverse[key]
+		value = self.dict.get(key, _DEFAULT)  # A single lookup for forward keys
+		return value if value is not _DEFAULT else self.inverse[key]
 
 	def __setitem__(self, key, value):
 		self.dict[key] = value
@@ -143,14 +177,14 @@ class BiDict(MutableMapping):
 
 	def set(self, key, value):
 		""" Set a key-value pair, checking for existing keys in `self.inverse` too. """
-		if key in self.inverse and not key in self.dict:
+		if key not in self.dict and key in self.inverse:
 			self[value] = key
 		else:
 			self[key] = value
 
 	def del_(self, key):
 		""" Delete a key-value pair, checking for existing keys in `self.inverse` too. """
-		if key in self.inverse and not key in self.dict:
+		if key not in self.dict and key in self.inverse:
 			del self[self.inverse[key]]
 		else:
 			del self[key]
@@ -159,20 +193,28 @@ class BiDict(MutableMapping):
 class SparseGrid(MutableMapping):
 	""" An n-dimensional grid saved in a sparse format. """
 
+	__slots__ = ('_dimensions', '_grid', '_keys', '_coords')
+
 	def __init__(self, dimensions=2):
 		self._dimensions = dimensions
 		self._grid = {}
+		# Cached list of the coordinates and the corresponding (N, dimensions) array, see `within`
+		# Only adding or removing coordinates (or reordering them) invalidates them, overwriting values doesn't
+		self._keys = self._coords = None
 
 	def __getitem__(self, coords):
 		return self._grid[coords]
 
 	def __setitem__(self, coords, value):
-		if len(coords) != self.dimensions:
+		if len(coords) != self._dimensions:
 			self._raise(coords)
+		if coords not in self._grid:
+			self._keys = self._coords = None
 		self._grid[coords] = value
 
 	def __delitem__(self, coords):
 		del self._grid[coords]
+		self._keys = self._coords = None
 
 	def __len__(self):
 		return len(self._grid)
@@ -184,7 +226,7 @@ class SparseGrid(MutableMapping):
 		return value in self._grid.values()
 
 	def _raise(self, coords):
-		raise ValueError(f"Expected {self.dimensions} coordinates, got {len(coords)}: {coords}")
+		raise ValueError(f"Expected {self._dimensions} coordinates, got {len(coords)}: {coords}")
 
 	def __repr__(self):
 		return f"{type(self).__name__}({self._grid})"
@@ -220,6 +262,29 @@ class SparseGrid(MutableMapping):
 			By default, the coordinate sum is used. This way nearby coordinates are hopefully close in the final sorted order.
 		"""
 		self._grid = dict(sorted(self._grid.items(), key=key or self._sort_key))
+		self._keys = self._coords = None
+
+	def within(self, lower, upper):
+		"""
+		Iterate over the (coordinates, value) pairs that lie inside a box, in the grid's current order.
+
+		The coordinates are stored in a NumPy array between modifications of the grid,
+		so repeated queries on an unchanged (e.g. sorted) grid are vectorised.
+
+		Parameters
+		----------
+		lower, upper : Sequence[Number]
+			The (inclusive) lower and upper corners of the box.
+		"""
+		if self._coords is None:
+			self._keys = list(self._grid)
+			self._coords = np.array(self._keys, ndmin=2).reshape(-1, self._dimensions)
+		inside = ((self._coords >= lower) & (self._coords <= upper)).all(axis=1)
+		# Values are looked up per match (rather than cached), since overwriting them keeps the cache
+		keys, grid = self._keys, self._grid
+		for i in np.flatnonzero(inside):
+			coords = keys[i]
+			yield coords, grid[coords]
 
 	@staticmethod
 	def _sort_key(coords_and_element):
@@ -230,31 +295,39 @@ class SparseGrid(MutableMapping):
 class SparseMultiGrid(SparseGrid):
 	""" An `SparseGrid` that allows multiple values at the same coordinates. """
 
+	__slots__ = ()
+
 	def __init__(self, dimensions=2):
 		super().__init__(dimensions)
 		self._grid = defaultdict(list)
 
 	def __getitem__(self, coords):
-		if len(coords) == self.dimensions + 1:
-			return self._grid[coords[:-1]][coords[-1]]
-		return super().__getitem__(coords)
+		if len(coords) == self._dimensions + 1:
+			return self._cell(coords[:-1])[coords[-1]]
+		return self._cell(coords)
 
 	def __setitem__(self, coords, value):
-		if len(coords) == self.dimensions:
+		if len(coords) == self._dimensions:
 			raise NotImplementedError("Cannot set element in multi-grid. Use add method instead.")
-		if len(coords) == self.dimensions + 1:
-			self._grid[coords[:-1]][coords[-1]] = value
+		if len(coords) == self._dimensions + 1:
+			self._cell(coords[:-1])[coords[-1]] = value
 		else:
 			self._raise(coords)
 
 	def __delitem__(self, coords):
-		if len(coords) == self.dimensions + 1:
-			del self._grid[coords[:-1]][coords[-1]]
+		if len(coords) == self._dimensions + 1:
+			del self._cell(coords[:-1])[coords[-1]]
 		else:
 			return super().__delitem__(coords)
 
+	def _cell(self, coords):
+		# Looking up missing coordinates inserts an empty cell into the defaultdict, which changes the coordinates
+		if coords not in self._grid:
+			self._keys = self._coords = None
+		return self._grid[coords]
+
 	def __len__(self):
-		return sum(len(v) for v in self._grid.values())
+		return sum(map(len, self._grid.values()))
 
 	def __iter__(self):
 		return it.chain.from_iterable(self._grid.values())
@@ -263,17 +336,17 @@ class SparseMultiGrid(SparseGrid):
 		return any(value in v for v in self._grid.values())
 
 	def add(self, coords, value):
-		if len(coords) != self.dimensions:
+		if len(coords) != self._dimensions:
 			self._raise(coords)
-		return self[coords].append(value)
+		return self._cell(coords).append(value)
 
 	def insert(self, coords, value, index=-1):
-		if len(coords) == self.dimensions + 1:
+		if len(coords) == self._dimensions + 1:
 			index = coords[-1]
 			coords = coords[:-1]
-		if len(coords) != self.dimensions:
+		if len(coords) != self._dimensions:
 			self._raise(coords)
-		return self[coords].insert(index, value)
+		return self._cell(coords).insert(index, value)
 
 	def remove(self, value):
 		for coords, values in self._grid.items():
@@ -1,4 +1,5 @@
 from ast import literal_eval
+from collections import deque
 from collections.abc import MutableMapping, Mapping
 from configparser import ConfigParser
 from copy import deepcopy
@@ -34,17 +35,60 @@ class Config(SimpleNamespace, MutableMapping):
 			kw = d | kw  # In case of key clashes, values from **kw prevail
 		super().__init__(**kw)
 
-		# Recursively convert all nested dicts to Configs
-		for key, value in self.items():
-			self[key] = self._recursive_init(value)
+		# Convert all nested dicts to Configs
+		self._init_nested(self.__dict__)
+
+	# Types that can be skipped without any further checks when converting nested dicts
+	_LEAF_TYPES = frozenset((bool, int, float, complex, str, bytes, type(None)))
+	# Containers that are searched for nested dicts and rebuilt as new objects of the same type; other iterables are kept as they are
+	_CONTAINER_TYPES = frozenset((list, tuple, set, frozenset, deque))
 
 	@classmethod
 	def _recursive_init(cls, value):
-		if isinstance(value, Mapping) and not isinstance(value, Config):
-			return cls(value)
-		if is_iterable(value, (str, bytes, Config)):
-			return type(value)(cls._recursive_init(item) for item in value)
-		return value
+		holder = [value]
+		cls._init_nested(holder)
+		return holder[0]
+
+	@classmethod
+	def _init_nested(cls, root):
+		"""
+		Convert all dicts nested (at any depth) in `root` to :class:`Config`s.
+
+		`root` is either a list or the `__dict__` of a :class:`Config` and is modified in-place.
+		Mappings directly under a :class:`Config` (including other :class:`Config`s) are copied into new :class:`Config`s,
+		while :class:`Config`s inside containers are kept as they are. Nested containers are rebuilt as new objects of the same type,
+		the innermost ones first.
+
+		Instead of recursing, the nested values are processed from a worklist, so deep nesting doesn't cost a stack frame per level.
+		Subclasses that override `__init__` have their nested values constructed through it instead (one call per nested mapping),
+		so that their set-up always runs.
+		"""
+		fast_init = cls.__init__ is Config.__init__
+		worklist = [root]
+		rebuild = []
+		while worklist:
+			node = worklist.pop()
+			in_config = isinstance(node, dict)
+			for key, value in node.items() if in_config else enumerate(node):
+				type_ = type(value)
+				if type_ in cls._LEAF_TYPES:
+					continue
+				if isinstance(value, Mapping):
+					if not in_config and isinstance(value, Config):
+						continue
+					if fast_init:
+						config = cls.__new__(cls)
+						SimpleNamespace.__init__(config, **value)
+						worklist.append(config.__dict__)
+					else:
+						config = cls(value)
+					node[key] = config
+				elif type_ in cls._CONTAINER_TYPES:
+					items = list(value)
+					rebuild.append((node, key, type_, items))
+					worklist.append(items)
+		for node, key, type_, items in reversed(rebuild):
+			node[key] = items if type_ is list else type_(items)
 
 	# Support shallow copying directly (like a dict does)
 	# For deep copying and pickling use copy.deepcopy and pickle instead
@@ -121,7 +165,7 @@ class Config(SimpleNamespace, MutableMapping):
 						self[key] |= value
 						continue
 					# Only merge non-leaf lists
-					if is_iterable(self[key], True) and is_iterable(value, True) and any(isinstance(v, Config) for v in flatten(self[key] + value, flatten_dicts=False)):
+					if is_iterable(self[key], True) and is_iterable(value, True) and any(isinstance(v, Config) for v in flatten(it.chain(self[key], value), flatten_dicts=False)):
 						#TODO: Right now this just shallowly merges the lists. Instead, could do something like
 						# value = set(value)
 						# for i, self_item in enumerate(self[key]):
@@ -204,15 +248,15 @@ class Config(SimpleNamespace, MutableMapping):
 	@classmethod
 	def _write_ini(cls, cfg, f, header=''):
 		indent = "\t" * (header.count('.') + 1 if header else 0)
-		leaves = [(k, v) for k, v in cfg.items() if not isinstance(v, Config)]
-		sections = [(k, v) for k, v in cfg.items() if isinstance(v, Config)]
+		leaves, sections = [], []
+		for key, value in cfg.items():
+			(sections if isinstance(value, Config) else leaves).append((key, value))
 
-		# Write out the leaves first
+		# Write out the leaves first (in a single write call)
 		if leaves:
-			for key, value in leaves:
-				print(f"{indent}{cls.ini_var2str(key)} = {value}", file=f)
+			f.write("".join(f"{indent}{cls.ini_var2str(key)} = {value}\n" for key, value in leaves))
 			if sections:  # Empty new line to end the section except at the end of the file
-				print(file=f)
+				f.write("\n")
 
 		# Write sections recursively
 		if sections:
@@ -220,7 +264,7 @@ class Config(SimpleNamespace, MutableMapping):
 				section_name = cls.ini_var2str(section_name)
 				if header:
 					section_name = f"{header}.{section_name}"
-				print(f"{indent}[{section_name}]", file=f)
+				f.write(f"{indent}[{section_name}]\n")
 				cls._write_ini(section, f, section_name)
 
 	@classmethod
@@ -278,15 +322,19 @@ class Config(SimpleNamespace, MutableMapping):
 			cfg[cls.ini_str2var(key)] = value
 
 	_replace_dict = {' ': '_', '_': '__', '-': '___'}
+	# Lookups derived from _replace_dict (subclasses overriding it should override these too)
+	_str2var_table = str.maketrans(_replace_dict)  # All keys are single characters, so str.translate can do the replacing
+	_var2str_dict = {v: k for k, v in _replace_dict.items()}
+
 	@classmethod
 	def ini_str2var(cls, key):
 		""" Translate INI section header or key to :class:`Config` attribute name. """
-		return multi_replace(key, cls._replace_dict).lower()
+		return key.translate(cls._str2var_table).lower()
 
 	@classmethod
 	def ini_var2str(cls, attr):
 		""" Translate :class:`Config` attribute name to INI section header or key. """
-		return multi_replace(attr, {v: k for k, v in cls._replace_dict.items()}).title()
+		return multi_replace(attr, cls._var2str_dict).title()
 
 	####################################
 	# Support YAML writing and reading #
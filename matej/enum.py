@@ -1,32 +1,46 @@
 from abc import ABCMeta, abstractmethod
 from enum import Enum, EnumMeta
-from functools import lru_cache, total_ordering
+from functools import total_ordering
 
-from matej.collections import lmap, sum_
+from matej.collections import lmap
 
 
 # Ordered Enums courtesy of https://blog.yossarian.net/2020/03/02/Totally-ordered-enums-in-python-with-ordered_enum
 @total_ordering
 class OrderedEnum(Enum):
-	@classmethod
-	@lru_cache(maxsize=None)
-	def _member_list(cls):
-		return list(cls)
+	def __init_subclass__(cls, **kw):
+		super().__init_subclass__(**kw)
+		# Members are already created at this point, so their definition order can be stored once (keyed by name, since str hashes are cached)
+		cls._member_order = {name: i for i, name in enumerate(cls._member_names_)}
 
 	def __lt__(self, other):
 		if type(self) is not type(other):
 			return NotImplemented
-		member_list = self._member_list()
-		return member_list.index(self) < member_list.index(other)
+		return self._member_order[self._name_] < self._member_order[other._name_]
 
 
-@total_ordering
+# All four comparisons are defined explicitly, since those derived by total_ordering make two comparisons each
 class ValueOrderedEnum(Enum):
 	def __lt__(self, other):
 		if type(self) is not type(other):
 			return NotImplemented
 		return self.value < other.value
 
+	def __le__(self, other):
+		if type(self) is not type(other):
+			return NotImplemented
+		return self.value <= other.value
+
+	def __gt__(self, other):
+		if type(self) is not type(other):
+			return NotImplemented
+		return self.value > other.value
+
+	def __ge__(self, other):
+		if type(self) is not type(other):
+			return NotImplemented
+		return self.value >= other.value
+
 
 class AbstractEnumMeta(EnumMeta, ABCMeta):
 	"""
@@ -54,8 +68,10 @@ class DirectEnumMeta(EnumMeta):
 	"""
 
 	def __getattribute__(cls, name):
-		result = super().__getattribute__(name)
-		if isinstance(result, cls):
+		getattribute = super().__getattribute__
+		result = getattribute(name)
+		# A name check against the member map is cheaper than an isinstance check
+		if name[:1] != '_' and name in getattribute('_member_map_'):
 			result = result.value
 		return result
 
@@ -74,12 +90,31 @@ class AbstractDirectEnumMeta(AbstractEnumMeta):
 	"""
 
 	def __getattribute__(cls, name):
-		result = super().__getattribute__(name)
-		if not name.startswith('_') and isinstance(result, cls):
+		getattribute = super().__getattribute__
+		result = getattribute(name)
+		# A name check against the member map is cheaper than an isinstance check (especially against an ABCMeta class)
+		if name[:1] != '_' and name in getattribute('_member_map_'):
 			result = result.value
 		return result
 
 
+class _LazyValue:
+	"""
+	Descriptor for the `value` of :class:`LazyEnum` members.
+
+	The first access triggers lazy initialisation and then stores the value in the member's `__dict__`. Since this is a non-data descriptor,
+	the stored value then shadows it (like with :func:`functools.cached_property`), so later accesses are plain attribute lookups.
+	"""
+
+	def __get__(self, member, owner=None):
+		if member is None:
+			return self
+		if member._lazy_args is not None:
+			member._initialise()
+		member.__dict__['value'] = member._value_
+		return member._value_
+
+
 class LazyEnum(Enum, metaclass=AbstractEnumMeta):
 	"""
 	An abstract subclass of :class:`~enum.Enum` that supports lazy evaluation of the members' values and attributes.
@@ -127,14 +162,20 @@ class LazyEnum(Enum, metaclass=AbstractEnumMeta):
 	def __init__(self, *args):
 		self._lazy_args = args
 
-	def __getattribute__(self, name):
-		if name.startswith('_') or self._lazy_args is None or (name != 'value' and name in self.__dict__):
-			return super().__getattribute__(name)
+	# Regular attribute lookup is left alone, so only `value` and the attributes that don't exist yet can trigger lazy initialisation
+	value = _LazyValue()
+
+	def __getattr__(self, name):
+		if name.startswith('_') or self.__dict__.get('_lazy_args') is None:
+			raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+		self._initialise()
+		return getattr(self, name)
+
+	def _initialise(self):
 		result = self._lazy_init(*self._lazy_args)
 		self._lazy_args = None
 		if result is not None:
 			self._value_ = result  #pylint: disable = attribute-defined-outside-init
-		return getattr(self, name)
 
 	@abstractmethod
 	def _lazy_init(self, *args):
@@ -241,13 +282,18 @@ class LazyEagerEnum(LazyEnum):
 	def __init__(self, *args):
 		# If we wanted to actually remove the lazy arguments from the __init__ call (so that we wouldn't need self.init_args),
 		# we'd need to override __call__ in the metaclass. Since this is a horrid idea for Enums, we use this solution instead.
-		lazy_args = sum_(arg.args for arg in args if isinstance(arg, Lazy))
+		lazy_args, init_args = [], []
+		for arg in args:
+			if isinstance(arg, Lazy):
+				lazy_args.extend(arg.args)
+			else:
+				init_args.append(arg)
 		if lazy_args:
 			super().__init__(*lazy_args)
 		else:
 			# No Lazy arguments (we can't use super().__init__ here)
 			self._lazy_args = None
-		self.init_args = tuple(arg for arg in args if not isinstance(arg, Lazy))
+		self.init_args = tuple(init_args)
 
 	@abstractmethod
 	def _lazy_init(self, *args):
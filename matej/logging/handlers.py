@@ -1,19 +1,20 @@
 import logging
 import sys
+from types import MappingProxyType
 from .filters import MaxLevelFilter
 from .formatters import BasicFormatter, ISOFormatter
 
 
 class _Handler(logging.Handler):
-	""" Base class for custom handlers. """
-	def __init__(self, level=logging.NOTSET, max_level=None, formatter=BasicFormatter(), *filters, **kw):
+	""" Base class for custom handlers. `formatter` can be a formatter instance or a class that is instantiated for this handler. """
+	def __init__(self, level=logging.NOTSET, max_level=None, formatter=BasicFormatter, *filters, **kw):
 		super().__init__(level, **kw)
 		self.setLevel(level)
-		self.setFormatter(formatter)
-		if max_level is not None:
-			self.addFilter(MaxLevelFilter(max_level))
-		for filter in filters:
-			self.addFilter(filter)
+		# Classes are instantiated per handler, so that handlers using the defaults don't share (and reconfigure each other's) formatters
+		self.setFormatter(formatter() if isinstance(formatter, type) else formatter)
+		# No records can be handled yet, so the filters can be set directly instead of through addFilter
+		self.filters = [MaxLevelFilter(max_level)] if max_level is not None else []
+		self.filters.extend(filters)
 
 
 class StdoutHandler(logging.StreamHandler, _Handler):
@@ -37,6 +38,20 @@ class FileHandler(logging.FileHandler, _Handler):
 		_Handler.__init__(self, *args, **kw)
 
 
+_DEFAULT_STDERR_CFG = MappingProxyType({
+	'level': logging.WARNING,
+	'formatter': BasicFormatter,
+})
+_DEFAULT_STDOUT_CFG = MappingProxyType({
+	'level': logging.DEBUG,
+	'formatter': BasicFormatter,
+})
+_DEFAULT_FILE_CFG = MappingProxyType({
+	'level': logging.DEBUG,
+	'formatter': ISOFormatter,
+})
+
+
 def console_handler_combo(stdout_cfg=None, stderr_cfg=None):
 	"""
 	A `logging.Handler` combination that enables console logging.
@@ -45,17 +60,9 @@ def console_handler_combo(stdout_cfg=None, stderr_cfg=None):
 	If a level is set to `None`, the corresponding stream will not be used.
 	By default, the this will log warnings and errors to `stderr` and everything else to `stdout`.
 	"""
-	default_stderr_cfg = {
-		'level': logging.WARNING,
-		'formatter': BasicFormatter(),
-	}
-	stderr_cfg = default_stderr_cfg if stderr_cfg is None else default_stderr_cfg | stderr_cfg
-	default_stdout_cfg = {
-		'level': logging.DEBUG,
-		'formatter': BasicFormatter(),
-		'max_level': stderr_cfg['level'],
-	}
-	stdout_cfg = default_stdout_cfg if stdout_cfg is None else default_stdout_cfg | stdout_cfg
+	stderr_cfg = _DEFAULT_STDERR_CFG if stderr_cfg is None else _DEFAULT_STDERR_CFG | stderr_cfg
+	# The default max level of stdout depends on stderr, so this merge can't be skipped
+	stdout_cfg = {**_DEFAULT_STDOUT_CFG, 'max_level': stderr_cfg['level'], **(stdout_cfg or {})}
 
 	handlers = []
 	if stdout_cfg['level'] is not None:
@@ -74,18 +81,13 @@ def tee_handler_combo(file=None, file_cfg=None, *args, **kw):
 	By default, the logger will log everything to the file and only warnings and errors to `stderr`.
 	"""
 	if file is None:
-		import inspect
-		file = f'{inspect.getmodule(inspect.stack()[1][0]).__name__}.log'
-	default_file_cfg = {
-		'level': logging.DEBUG,
-		'formatter': ISOFormatter(),
-	}
+		file = f"{sys._getframe(1).f_globals.get('__name__', '__main__')}.log"
 	if args:
 		stdout_cfg = args[0]
 		args = args[1:]
 	else:
 		stdout_cfg = kw.pop('stdout_cfg', {'level': None})
-	file_cfg = default_file_cfg if file_cfg is None else default_file_cfg | file_cfg
+	file_cfg = _DEFAULT_FILE_CFG if file_cfg is None else _DEFAULT_FILE_CFG | file_cfg
 
 	handlers = console_handler_combo(stdout_cfg, **kw)
 	if file_cfg['level'] is not None:
@@ -1,12 +1,16 @@
 import atexit
 import logging
 import logging.handlers
+import sys
 import warnings
 
 
+_manager = logging.Logger.manager  # Module-level singleton shared by all loggers
+
+
 class _LoggerMeta(type):
 	def __call__(cls, name, *args, **kw):
-		if name in logging.Logger.manager.loggerDict:
+		if name in _manager.loggerDict:
 			logger = logging.getLogger(name)
 			if isinstance(logger, cls) and not args and not kw:
 				warnings.warn(f"Logger {name} already exists. The preferred method of accessing the existing logger is `logging.getLogger({name})`.", stacklevel=2)
@@ -15,7 +19,7 @@ class _LoggerMeta(type):
 		# This is hacky but it's the best way I could figure out to properly instantiate and register the logger
 		logger = cls.__new__(cls, name, *args, **kw)
 		logger.__init__(name, *args, **kw)
-		logger.manager = logging.Logger.manager
+		logger.manager = _manager
 		logger.manager.loggerDict[name] = logger
 		logger.manager._fixupParents(logger)
 		return logger
@@ -25,8 +29,7 @@ class Logger(logging.Logger, metaclass=_LoggerMeta):
 	""" A simple `logging.Logger` that can also be used as a base class for custom loggers. """
 	def __init__(self, name=None, *handlers):
 		if name is None:
-			import inspect
-			name = inspect.getmodule(inspect.stack()[1][0]).__name__
+			name = sys._getframe(1).f_globals.get('__name__', '__main__')
 			warnings.warn("Logger name not provided. Initialising with module name ('{name}'). Providing an explicit name is recommended.", stacklevel=2)
 		super().__init__(name)
 		for handler in handlers:
@@ -55,26 +58,32 @@ class QueueLogger(Logger):
 		self.listener.start()
 
 	def addHandler(self, handler):
+		self.addHandlers(handler)
+
+	def addHandlers(self, *handlers):
+		""" Add multiple handlers at once, so that the listener only has to be restarted once. """
 		# Stop and restart the listener when adding handlers to avoid race conditions
 		self.listener.stop()
-		self.listener.handlers = (*self.listener.handlers, handler)
+		self.listener.handlers += handlers
+		self._handlers_changed()
 		self.listener.start()
 
 	def removeHandler(self, handler):
 		# Stop and restart the listener when removing handlers to avoid race conditions
 		self.listener.stop()
 		self.listener.handlers = tuple(h for h in self.listener.handlers if h is not handler)
+		self._handlers_changed()
 		self.listener.start()
 
+	def _handlers_changed(self):
+		# The effective level may have changed, so clear logging's isEnabledFor caches (of this logger and its children)
+		self.manager._clear_cache()
+
 	@property
 	def level(self):
 		if self._level is None:
 			# Level hasn't been explicitly set, so return the minimum level of all handlers (so we don't inherit the WARNING level of the root logger)
-			try:
-				return min(h.level for h in self.listener.handlers)
-			except ValueError:
-				# No handlers, so return NOTSET
-				return logging.NOTSET
+			return min((h.level for h in self.listener.handlers), default=logging.NOTSET)  # NOTSET if there are no handlers
 		return self._level
 
 	@level.setter
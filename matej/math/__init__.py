@@ -1,14 +1,18 @@
-from copy import deepcopy
-from functools import reduce
+from collections import deque
+from contextlib import nullcontext
+from functools import lru_cache
+import itertools as it
 import math
 import multiprocessing
 import numpy as np
-import operator as op
 import threading
 
 from matej import Singleton
 
 
+_sqrt = math.sqrt  # Bound once, since it's called on every scalar RunningStats update
+
+
 class _Zero(metaclass=Singleton):
 	def __add__(self, other):
 		return other
@@ -70,14 +74,13 @@ class _One(metaclass=Singleton):
 ONE = _One()
 
 
-def ncr(n, r):
-	r = min(r, n - r)
-	numerator = reduce(op.mul, range(n - r + 1, n + 1), 1)
-	return numerator // math.factorial(r)
+# Kept for backward compatibility, math.comb is implemented in C
+ncr = math.comb
 
 
+@lru_cache(maxsize=1024)
 def dfactorial(n):
-	return reduce(op.mul, range(n, 2, -2), 1)
+	return math.prod(range(n, 1, -2))
 
 
 _ORDINAL_SUFFIXES = {1: "st", 2: "nd", 3: "rd"}
@@ -87,6 +90,8 @@ def ordinal(n):
 
 
 class RunningStats:
+	__slots__ = ('name', 'mean', 'var', 'std', '_n', '_s', '_ddof', '_parallel', '_lock', '_cache')
+
 	def __init__(self, name="", init_values=None, ddof=0, parallel=None, max_cache_size=100):
 		self.name = name
 
@@ -98,37 +103,51 @@ class RunningStats:
 		self._s = 0
 		self._ddof = ddof
 		self._parallel = parallel
-		self._lock = None
+		self._init_lock()
 
-		self._cache = []
-		self._cache_len = max_cache_size
+		self._cache = deque(maxlen=max_cache_size)
 
 		if init_values is not None:
 			self.update(init_values)
 
-		self._init_lock()
-
-	# Welford's algorithm update step
+	# Batched Welford's algorithm update step (combines the batch's statistics with the current ones as in Chan et al.)
+	# A batch of shape (n_samples, n_dims) (e.g. pixels × channels) updates per-dimension statistics in a single call
 	def update(self, values):
-		if self._parallel:
-			self._lock.acquire()
-
-		values = np.array(values, ndmin=1)
+		if np.isscalar(values):
+			return self.update_single(values)
+		values = np.atleast_1d(np.asarray(values))
 		n = len(values)
-
-		self._n += n
-		self._cache.extend(values)
-		self._cache = self._cache[-self._cache_len:]
-
-		delta = values - self.mean
-		self.mean += (delta / self._n).sum()
-
-		self._s += (delta * (values - self.mean)).sum()
-		self.var = self._s / (self._n - self._ddof) if self._n > self._ddof else 0
-		self.std = np.sqrt(self.var)
-
-		if self._parallel:
-			self._lock.release()
+		if not n:
+			return
+
+		with self._lock:
+			# Only the last maxlen values would stay in the cache, so don't box and push the rest
+			maxlen = self._cache.maxlen
+			kept = values if maxlen is None or n <= maxlen else values[n - maxlen:]
+			# Rows of a 2-D batch are views, so copy them in case the caller reuses the buffer
+			self._cache.extend(kept.copy() if values.ndim > 1 else kept)
+
+			mean = values.mean(axis=0)
+			delta = mean - self.mean
+			total = self._n + n
+			self.mean = self.mean + delta * n / total
+			self._s = self._s + ((values - mean) ** 2).sum(axis=0) + delta ** 2 * self._n * n / total
+			self._n = total
+			self.var = self._s / (self._n - self._ddof) if self._n > self._ddof else 0
+			self.std = np.sqrt(self.var) if values.ndim > 1 else _sqrt(self.var)
+
+	# Single-value Welford's algorithm update step (avoids the array overhead of update when streaming one sample at a time)
+	def update_single(self, value):
+		with self._lock:
+			self._cache.append(value)
+
+			self._n += 1
+			delta = value - self.mean
+			self.mean = self.mean + delta / self._n
+			self._s = self._s + delta * (value - self.mean)
+			self.var = self._s / (self._n - self._ddof) if self._n > self._ddof else 0
+			# A streamed row of vector-valued stats needs np.sqrt, plain scalars take the faster math.sqrt
+			self.std = np.sqrt(self.var) if type(self.var) is np.ndarray else _sqrt(self.var)
 
 	def last(self, n=1):
 		if n == 1:
@@ -136,17 +155,20 @@ class RunningStats:
 		elif n == 'all':
 			return list(self._cache)
 		else:
-			return self._cache[-n:]
+			return list(it.islice(self._cache, max(len(self._cache) - n, 0), None))
 
 	def latex(self, *args, include_name=True, format_f=np.format_float_positional, **kw):
-		result = f"{self.name} & " if include_name else ""
-		mean = format_f(self.mean, *args, **kw)
-		std = format_f(self.std, *args, **kw)
-		result += "$" + (fr"{mean} \pm {std}" if self.std else mean) + "$"
-		return result
+		cells = [self.name] if include_name else []
+		# Vector-valued stats get a table cell per dimension
+		means = np.ravel(self.mean)
+		stds = np.broadcast_to(self.std, np.shape(self.mean)).ravel()
+		for mean, std in zip(means, stds):
+			mean_str = format_f(mean, *args, **kw)
+			cells.append("$" + (fr"{mean_str} \pm {format_f(std, *args, **kw)}" if std else mean_str) + "$")
+		return " & ".join(cells)
 
 	def __str__(self):
-		if self.std:
+		if np.any(self.std):
 			#return f"{self.name} (\u03BC \u00B1 \u03C3): {self.mean} \u00B1 {self.std}"
 			return f"{self.name} (μ ± σ): {self.mean} ± {self.std}"
 		else:
@@ -156,39 +178,48 @@ class RunningStats:
 		return self._n
 
 	def _init_lock(self):
+		# Without parallelism a no-op context manager is used, so the update methods don't need to check for a lock
 		if self._parallel == 'multiprocessing':
 			self._lock = multiprocessing.Lock()
 		elif self._parallel == 'threading':
 			self._lock = threading.Lock()
+		elif not self._parallel:
+			self._lock = nullcontext()
+		else:
+			raise ValueError(f"Unknown parallel mode: {self._parallel}. Expected 'multiprocessing', 'threading', or None.")
+
+	# Cheaper than deepcopy, since only the cache needs to be copied (and the lock recreated)
+	def copy(self):
+		new = self.__class__.__new__(self.__class__)
+		new.__setstate__(self.__getstate__())
+		new._cache = self._cache.copy()
+		return new
 
 	# Support for pickling and deepcopy
 	def __getstate__(self):
-		state = self.__dict__.copy()
-		if '_lock' in state:
-			del state['_lock']
-		return state
+		return {attr: getattr(self, attr) for attr in self.__slots__ if attr != '_lock'}
 
 	def __setstate__(self, state):
-		self.__dict__ = state
+		for attr, value in state.items():
+			setattr(self, attr, value)
 		self._init_lock()
 
 	# Concatenated streams (https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm)
 	def __ior__(self, other):
-		if self._parallel:
-			self._lock.acquire()
-
-		n = self._n + other._n
-		delta = other.mean - self.mean
-		self.mean = (self._n * self.mean + other._n * other.mean) / n
-		self._s += other._s + delta ** 2 * self._n * other._n / n
-		self.var = self._s / (n - self._ddof)
-		self.std = np.sqrt(self.var)
-		self._n = n
-
-		if self._parallel:
-			self._lock.release()
+		if not other._n:
+			return self
+
+		with self._lock:
+			n = self._n + other._n
+			delta = other.mean - self.mean
+			# Incremental form of the weighted mean, which doesn't cancel catastrophically for large, close means
+			self.mean = self.mean + delta * other._n / n
+			self._s = self._s + other._s + delta ** 2 * self._n * other._n / n
+			self.var = self._s / (n - self._ddof) if n > self._ddof else 0
+			self.std = np.sqrt(self.var) if type(self.var) is np.ndarray else _sqrt(self.var)
+			self._n = n
 
 		return self
 
 	def __or__(self, other):
-		return deepcopy(self).__ior__(other)
+		return self.copy().__ior__(other)
@@ -1,19 +1,29 @@
 import operator as op
 import math
-import string
+import re
 from itertools import chain
 from enum import Enum
+from functools import lru_cache
+import numpy as np
 
-import . as utils
+from matej import math as utils
 
 
 Associativity = Enum('Associativity', 'LEFT RIGHT')
 Arity = Enum('Arity', 'UNARY BINARY')
 
+# integer token kinds, so the parsing and evaluation loops can dispatch without isinstance checks
+_OTHER, _NUMBER, _VARIABLE, _LBR, _RBR, _OPERATOR = range(6)
+
 
 class Token:
-    def __init__(self, s, group=None):
+    kind = _OTHER
+
+    def __init__(self, s, group=None, kind=None):
         self.str = (s,) if isinstance(s, str) else s
+        self._printed = self.str[0]  # representation used by prepare
+        if kind is not None:
+            self.kind = kind
         if group is not None:
             group.append(self)
 
@@ -22,14 +32,16 @@ class Token:
 
 
 brackets = []
-LBR = Token(('(', '['), brackets)
-RBR = Token((')', ']'), brackets)
+LBR = Token(('(', '['), brackets, _LBR)
+RBR = Token((')', ']'), brackets, _RBR)
 LABS = Token('|', brackets)
 RABS = Token('|', brackets)
 brackets = tuple(brackets)
 
 
 class Number(Token):
+    kind = _NUMBER
+
     def __init__(self, value, s=None, group=None):
         super().__init__(s if s else str(value), group)
         self.value = value
@@ -45,16 +57,40 @@ PLANCK = Number(6.62606957e-34, 'h', constants)
 constants = tuple(constants)
 
 
+# free variable, whose values are passed to calculate_vec
+class Variable(Token):
+    kind = _VARIABLE
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.name = name
+
+
 operators = []
 
 
 class Operator(Token):
-    def __init__(self, s, f, precedence, associativity=Associativity.LEFT, arity=Arity.BINARY, group=operators):
+    kind = _OPERATOR
+
+    # vf is the element-wise version of f used by calculate_vec (only needed if f doesn't support NumPy arrays)
+    def __init__(self, s, f, precedence, associativity=Associativity.LEFT, arity=Arity.BINARY, group=operators, vf=None):
         super().__init__(s, group)
         self.f = f
+        self.vf = f if vf is None else vf
         self.precedence = precedence
         self.associativity = associativity
         self.arity = arity
+        self.n_args = 2 if arity is Arity.BINARY else 1
+        # binding powers: an operator on the stack is popped when left_bp <= its right_bp
+        # (i.e. for left-associative t when prec(t) <= prec(t2), for right-associative t when prec(t) < prec(t2))
+        self.left_bp = 2 * precedence + (1 if associativity is Associativity.RIGHT else 0)
+        self.right_bp = 2 * precedence
+        if arity is Arity.BINARY:
+            self._printed = " " + self._printed + " "
+        elif associativity is Associativity.LEFT:
+            self._printed += " "
+        else:
+            self._printed = " " + self._printed
 
 
 PLUS = Operator('+', op.add, 0)
@@ -65,36 +101,51 @@ MULT = Operator(('·', '⋅', '*', '×', 'x'), op.mul, 20)
 DIV = Operator(('/', '÷'), op.truediv, 20)
 IDIV = Operator(('//', 'div'), op.floordiv, 20)
 MOD = Operator(('%', 'mod'), op.mod, 20)
-FACT = Operator('!', math.factorial, 50, arity=Arity.UNARY)
-DFACT = Operator('!!', utils.dfactorial, 50, arity=Arity.UNARY)
+FACT = Operator('!', math.factorial, 50, arity=Arity.UNARY, vf=np.vectorize(math.factorial))
+DFACT = Operator('!!', utils.dfactorial, 50, arity=Arity.UNARY, vf=np.vectorize(utils.dfactorial))
 DEG = Operator(('°', 'deg'), lambda x: x * math.pi / 180.0, 50, arity=Arity.UNARY)
 POW = Operator(('^', '**', 'pow'), op.pow, 30, Associativity.RIGHT)
-SIN = Operator('sin', math.sin, 40, Associativity.RIGHT, Arity.UNARY)
-COS = Operator('cos', math.cos, 40, Associativity.RIGHT, Arity.UNARY)
-TAN = Operator(('tan', 'tg'), math.tan, 40, Associativity.RIGHT, Arity.UNARY)
-CTG = Operator(('ctg', 'ctan', 'cotan'), lambda x: 1.0 / math.tan(x), 40, Associativity.RIGHT, Arity.UNARY)
-LOG = Operator(('log', 'ln'), math.log, 40, Associativity.RIGHT, Arity.UNARY)
+SIN = Operator('sin', math.sin, 40, Associativity.RIGHT, Arity.UNARY, vf=np.sin)
+COS = Operator('cos', math.cos, 40, Associativity.RIGHT, Arity.UNARY, vf=np.cos)
+TAN = Operator(('tan', 'tg'), math.tan, 40, Associativity.RIGHT, Arity.UNARY, vf=np.tan)
+CTG = Operator(('ctg', 'ctan', 'cotan'), lambda x: 1.0 / math.tan(x), 40, Associativity.RIGHT, Arity.UNARY, vf=lambda x: 1.0 / np.tan(x))
+LOG = Operator(('log', 'ln'), math.log, 40, Associativity.RIGHT, Arity.UNARY, vf=np.log)
 ABS = Operator('abs', abs, 40, Associativity.RIGHT, Arity.UNARY)
-FLOOR = Operator(('fl', 'floor'), math.floor, 40, Associativity.RIGHT, Arity.UNARY)
-CEIL = Operator(('ceil', 'ceiling'), math.ceil, 40, Associativity.RIGHT, Arity.UNARY)
+FLOOR = Operator(('fl', 'floor'), math.floor, 40, Associativity.RIGHT, Arity.UNARY, vf=np.floor)
+CEIL = Operator(('ceil', 'ceiling'), math.ceil, 40, Associativity.RIGHT, Arity.UNARY, vf=np.ceil)
 SQ = Operator('sq', lambda x: x * x, 40, Associativity.RIGHT, Arity.UNARY)
-SQRT = Operator('sqrt', math.sqrt, 40, Associativity.RIGHT, Arity.UNARY)
-CMB = Operator(('C', 'cmb', 'choose'), utils.ncr, 25)
-N_LOG = Operator(('nlog', 'log', 'loga'), lambda x, y: math.log(y, x), 25, Associativity.RIGHT)
-N_RT = Operator(('rt', 'nrt'), lambda x, y: math.pow(y, 1.0 / x), 25, Associativity.RIGHT)
-
-# Test operators
-LAB0 = Operator('+', op.add, 0)
-LAB1 = Operator('+', op.add, 1)
-RAB0 = Operator('**', op.add, 0, Associativity.RIGHT)
-RAB1 = Operator('**', op.add, 1, Associativity.RIGHT)
-LAU0 = Operator('!', op.neg, 0, arity=Arity.UNARY)
-LAU1 = Operator('!', op.neg, 1, arity=Arity.UNARY)
-RAU0 = Operator('-', math.factorial, 0, Associativity.RIGHT, Arity.UNARY)
-RAU1 = Operator('-', math.factorial, 1, Associativity.RIGHT, Arity.UNARY)
+SQRT = Operator('sqrt', math.sqrt, 40, Associativity.RIGHT, Arity.UNARY, vf=np.sqrt)
+CMB = Operator(('C', 'cmb', 'choose'), utils.ncr, 25, vf=np.vectorize(utils.ncr))
+N_LOG = Operator(('nlog', 'log', 'loga'), lambda x, y: math.log(y, x), 25, Associativity.RIGHT, vf=lambda x, y: np.log(y) / np.log(x))
+N_RT = Operator(('rt', 'nrt'), lambda x, y: math.pow(y, 1.0 / x), 25, Associativity.RIGHT, vf=lambda x, y: np.power(y, 1.0 / x))
+operators = tuple(operators)
 
 
-operators = tuple(operators)
+# shorthands for whether the operator o is binary, left-associative unary, or right-associative unary
+def _bin(o): return o.arity is Arity.BINARY
+def _lau(o): return o.arity is Arity.UNARY and o.associativity is Associativity.LEFT
+def _rau(o): return o.arity is Arity.UNARY and o.associativity is Associativity.RIGHT
+
+
+# operators that begin/end an expression
+_exp_start_ops = frozenset((*(o for o in operators if _rau(o)), LBR, LABS))
+_exp_end_ops = frozenset((*(o for o in operators if _lau(o)), RBR, RABS))
+
+
+# lower-cased spelling -> [(token, spelling)] in definition order (several tokens can share a spelling)
+_spellings = {}
+for t in chain(brackets, constants, operators):
+    for s in t.str:
+        _spellings.setdefault(s.lower(), []).append((t, s))
+del t, s
+
+# longest spellings first, so a match is always the longest token spelling at the given position
+_TOKEN_RE = re.compile('|'.join(map(re.escape, sorted(_spellings, key=len, reverse=True))), re.IGNORECASE)
+_NUMBER_RE = re.compile(
+    r'0[xX](?P<hex>[0-9a-fA-F]+)|0[bB](?P<bin>[01]+)|0[oO]?(?P<oct>[0-7]+)(?![\d.])|'
+    r'(?P<dec>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)'
+)  # decimal numbers may use any unicode digits (int and float parse them), and have a leading or trailing dot
+_WHITESPACE_RE = re.compile(r'\s*')
 
 
 def main():
@@ -112,82 +163,116 @@ def main():
             print(e)
 
 
+@lru_cache(maxsize=256)
 def calculate(exp):
-    tokens = _prepare(exp)
-    if not tokens:
+    rpn = _compile_rpn(exp)
+    if not rpn:
         return ""
-    rpn = _shunting_yard(tokens)
     return _evaluate(rpn)
 
 
+# evaluates exp element-wise over the NumPy arrays given for its variables (e.g. calculate_vec("sin x + y", x=xs, y=ys))
+def calculate_vec(exp, /, **variables):
+    rpn = _compile_rpn(exp, tuple(variables))
+    if not rpn:
+        return ""
+    return _evaluate(rpn, {name: np.asarray(value) for name, value in variables.items()}, vectorized=True)
+
+
+# parses exp once and returns a function of its variables' values (e.g. f = compile_expression("x^2 - 2", "x"); f(1.5))
+def compile_expression(exp, *variables):
+    rpn = _compile_rpn(exp, variables)
+    if not rpn:
+        raise ValueError("Empty expression.")
+
+    def evaluate(*values):
+        if len(values) != len(variables):
+            raise TypeError(f"Expected {len(variables)} values (for {', '.join(variables)}), got {len(values)}.")
+        return _evaluate(rpn, dict(zip(variables, values)))
+    return evaluate
+
+
 def prepare(exp):
     return _detokenize(_prepare(exp))
 
 
-def _prepare(exp):
-    tokens = _tokenize(exp)
+# cached separately from calculate, so that an expression is only parsed once even if evaluation fails
+@lru_cache(maxsize=256)
+def _compile_rpn(exp, variables=()):
+    tokens = _prepare(exp, variables)
+    return tuple(_shunting_yard(tokens)) if tokens else ()
+
+
+def _prepare(exp, variables=()):
+    tokens = _tokenize(exp, variables)
     _replace_abs_brackets(tokens)
     return tokens
 
 
-def _tokenize(exp):
+def _tokenize(exp, variables=()):
     tokens = []
-    i = 0
+    pos = _WHITESPACE_RE.match(exp).end()
     token = None
-    while i < len(exp):
-        while i < len(exp) and exp[i].isspace():
-            i += 1
-        if i < len(exp):
-            token, length = _get_token(exp, i, token)
-            tokens.append(token)
-            i += length
+    memo = {}
+    # variable names take precedence over other tokens, but only as whole words
+    var_re = re.compile(f"(?:{'|'.join(map(re.escape, sorted(variables, key=len, reverse=True)))})(?!\\w)") if variables else None
+    while pos < len(exp):
+        token, length = _get_token(exp, pos, token, memo, var_re)
+        if token is None:
+            raise ValueError("Illegal token: " + exp[pos:])
+        tokens.append(token)
+        pos = _WHITESPACE_RE.match(exp, pos + length).end()
     return tokens
 
 
 def _detokenize(tokens):
-    return "".join(_pretty_print(t) for t in tokens)
+    return "".join([t._printed for t in tokens])
 
 
-def _pretty_print(t):
-    s = str(t)
-    if isinstance(t, Operator):
-        if t.arity is Arity.BINARY:
-            return " " + s + " "
-        return s + " " if t.associativity is Associativity.LEFT else " " + s
-    return s
+# the arity checks look ahead recursively, so without memoisation runs of operators (e.g. 1----1) take exponential time
+def _get_token(exp, pos, prev_token, memo=None, var_re=None):
+    if memo is None:
+        memo = {}
+    key = pos, prev_token
+    if key not in memo:
+        memo[key] = _match_token(exp, pos, prev_token, memo, var_re)
+    return memo[key]
 
 
-def _get_token(exp, pos, prev_token):
-    if pos < 0 or pos >= len(exp):
+# returned length includes any whitespace skipped before the token
+def _match_token(exp, pos, prev_token, memo, var_re):
+    start = pos
+    pos = _WHITESPACE_RE.match(exp, pos).end()
+    if pos >= len(exp):
         return None, 0
 
     # special handling for abs value brackets
     if exp[pos] == '|':
-        return (LABS, 1) if _is_labs(exp, pos) else (RABS, 1)
-
-    if exp[pos].isdecimal():
-        return _get_number(exp, pos)
+        return (LABS if _is_labs(exp, pos) else RABS), pos + 1 - start
 
-    matches = [
-        (t, s)
-        for t in chain(brackets, constants, operators) for s in t.str
-        if exp.lower().startswith(s.lower(), pos)
-    ]
+    number = _NUMBER_RE.match(exp, pos)
+    if number:
+        return _get_number(number), number.end() - start
 
-    # filter out operators with incorrect arity and unary operators with incorrect associativity
-    matches = [
-        (t, s)
-        for t, s in matches
-        if not isinstance(t, Operator) or _check_arity(exp, pos, t, len(s), prev_token)
-    ]
+    variable = var_re and var_re.match(exp, pos)
+    if variable:
+        return Variable(variable[0]), variable.end() - start
 
-    if not matches:
+    m = _TOKEN_RE.match(exp, pos)
+    if not m:
         return None, 0
 
-    # filter out tokens with length lower than maximal
-    if len(matches) > 1:
-        m = max(len(s) for _, s in matches)
-        matches = [(t, s) for t, s in matches if len(s) == m]
+    # take the longest spelling that has a token with correct arity (and unary operators with correct associativity)
+    for end in range(m.end(), pos, -1):
+        matches = [
+            (t, s)
+            for t, s in _spellings.get(exp[pos:end].lower(), ())
+            if not isinstance(t, Operator) or _check_arity(exp, pos, t, len(s), prev_token, memo, var_re)
+        ]
+        if matches:
+            break
+    else:
+        return None, 0
 
     # filter out tokens with incorrect capitalisation
     if len(matches) > 1:
@@ -196,7 +281,7 @@ def _get_token(exp, pos, prev_token):
     if not matches:
         return None, 0
 
-    return matches[0][0], len(matches[0][1])
+    return matches[0][0], end - start
 
 
 def _is_labs(exp, pos):
@@ -214,86 +299,35 @@ def _is_labs(exp, pos):
     return exp.count('|', i, pos) % 2 == 0
 
 
-def _get_number(exp, pos):
-    i = pos
-    base = 10
-    digits = string.digits
-    x = 0
-
-    if exp[i] == '0' and i < len(exp) - 1:
-        i += 1
-        if exp[i].lower() in 'bx':
-            base = 2 if exp[i].lower() == 'b' else 16
-            digits = '01' if exp[i].lower() == 'b' else string.hexdigits
-            pos += 1
-        else:
-            base = 8
-            digits = string.octdigits
-            if exp[i].lower() == 'o':
-                i += 1
-
-    while i < len(exp) and exp[i] in digits:
-        x *= base
-        x += int(exp[i], base)
-        i += 1
-
-    if i < len(exp) and exp[i] == '.':
-        i += 1
-        p = 1.0 / base
-        while i < len(exp) and exp[i] in digits:
-            x += int(exp[i], base) * p
-            p /= base
-            i += 1
-
-    if i < len(exp) - 1 and exp[i].lower() == 'e' and exp[i + 1] in chain(digits, UPLUS.str, UMIN.str):
-        i += 1
-        sign = 1
-        p = 0
-        if exp[i] in chain(UPLUS.str, UMIN.str):
-            if exp[i] in UMIN.str:
-                sign = -1
-            i += 1
-        while i < len(exp) and exp[i] in digits:
-            p *= base
-            p += int(exp[i], base)
-            i += 1
-        x *= math.pow(base, sign * p)
-
-    return Number(x), i - pos
+def _get_number(match):
+    for group, base in (('hex', 16), ('bin', 2), ('oct', 8)):
+        if match[group]:
+            return Number(int(match[group], base))
+    s = match['dec']
+    return Number(int(s) if s.isdecimal() else float(s))
 
 
 # NOTE: this requires that implicit multiplication should not be allowed with operators (3log9 =/= 3 * log9)
-def _check_arity(exp, pos, t, t_len, left_token):
-    # shorthands for whether the operator o is binary, left-associative unary, or right-associative unary
-    def bin(o): return o.arity is Arity.BINARY
-    def lau(o): return o.arity is Arity.UNARY and o.associativity is Associativity.LEFT
-    def rau(o): return o.arity is Arity.UNARY and o.associativity is Associativity.RIGHT
-
-    # operators that begin/end an expression
-    exp_start_ops = [o for o in operators if rau(o)]
-    exp_start_ops.extend((LBR, LABS))
-    exp_end_ops = [o for o in operators if lau(o)]
-    exp_end_ops.extend((RBR, RABS))
-
+def _check_arity(exp, pos, t, t_len, left_token, memo=None, var_re=None):
     # if there is no token to the left, check fails for binary and left-associative unary operators
-    if not left_token and (bin(t) or lau(t)):
+    if not left_token and (_bin(t) or _lau(t)):
         return False
 
     # if it's a number/constant or the end of an expression, check fails for right-associative unary operators
     # otherwise it fails for all others
-    if (isinstance(left_token, Number) or left_token in exp_end_ops) == rau(t):
+    if (isinstance(left_token, (Number, Variable)) or left_token in _exp_end_ops) == _rau(t):
         return False
 
     # find the first token to the right
-    right_token = _get_token(exp, pos + t_len, t)[0]
+    right_token = _get_token(exp, pos + t_len, t, memo, var_re)[0]
 
     # if there is no token to the right, check fails for binary and right-associative unary operators
-    if not right_token and (bin(t) or rau(t)):
+    if not right_token and (_bin(t) or _rau(t)):
         return False
 
     # if it's a number/constant or the end of an expression, check fails for left-associative unary operators
     # otherwise it fails for all others
-    if (isinstance(right_token, Number) or right_token in exp_start_ops) == lau(t):
+    if (isinstance(right_token, (Number, Variable)) or right_token in _exp_start_ops) == _lau(t):
         return False
 
     return True
@@ -301,65 +335,50 @@ def _check_arity(exp, pos, t, t_len, left_token):
 
 # Replaces |exp| with abs(exp)
 def _replace_abs_brackets(tokens):
-    i = 0
-    while i < len(tokens):
-        if tokens[i] is LABS:
-            tokens.insert(i, ABS)
-            i += 1
-            tokens[_find_paired_bracket(tokens, i)] = RBR
-            tokens[i] = LBR
-        i += 1
-
-
-def _find_paired_bracket(tokens, pos):
-    br = tokens[pos]
-    left = LBR, LABS
-    right = RBR, RABS
-    if br in left:
-        p_br = RBR if br is LBR else RABS
-        step = 1
-    else:
-        p_br = LBR if br is RBR else LABS
-        step = -1
-
-    depth = 0
-    pos += step
-    while 0 <= pos < len(tokens):
-        if depth < 0:
-            return None
-        if tokens[pos] is p_br and depth == 0:
-            return pos
-        if tokens[pos] in left:
-            depth += step
-        elif tokens[pos] in right:
-            depth -= step
-        pos += step
+    # pair up the brackets in a single pass, so each closing abs bracket is known without scanning for it
+    stack = []
+    closing = set()
+    for i, t in enumerate(tokens):
+        if t is LBR or t is LABS:
+            stack.append(t)
+        elif (t is RBR or t is RABS) and stack:
+            if (stack.pop() is LABS) != (t is RABS):
+                raise ValueError("Mismatched brackets.")
+            if t is RABS:
+                closing.add(i)
+    if LABS in stack:
+        raise ValueError("Mismatched brackets.")
+
+    result = []
+    for i, t in enumerate(tokens):
+        if t is LABS:
+            result += ABS, LBR
+        else:
+            result.append(RBR if i in closing else t)
+    tokens[:] = result
 
 
 def _shunting_yard(tokens):
     queue = []
     stack = []
     for t in tokens:
-        if isinstance(t, Number):
+        k = t.kind
+        if k == _NUMBER or k == _VARIABLE:
             queue.append(t)
 
-        elif isinstance(t, Operator):
+        elif k == _OPERATOR:
             while stack:
-                t2 = stack.pop()
-                if isinstance(t2, Operator) and (
-                    t.associativity is Associativity.LEFT and t.precedence <= t2.precedence or
-                    t.associativity is Associativity.RIGHT and t.precedence < t2.precedence
-                ):
-                    queue.append(t2)
+                t2 = stack[-1]
+                if t2.kind == _OPERATOR and t.left_bp <= t2.right_bp:
+                    queue.append(stack.pop())
                 else:
-                    stack.append(t2)
                     break
             stack.append(t)
 
-        elif t is LBR:
+        elif k == _LBR:
             stack.append(t)
 
-        elif t is RBR:
+        elif k == _RBR:
             while stack:
                 t2 = stack.pop()
                 if t2 is LBR:
@@ -373,27 +392,31 @@ def _shunting_yard(tokens):
 
     while stack:
         t = stack.pop()
-        if t in brackets:
+        if t.kind != _OPERATOR:
             raise ValueError("Mismatched brackets.")
         queue.append(t)
 
     return queue
 
 
-def _evaluate(rpn):
+def _evaluate(rpn, variables=None, vectorized=False):
     stack = []
     for t in rpn:
-        if isinstance(t, Number):
+        k = t.kind
+        if k == _NUMBER:
             stack.append(t.value)
 
-        elif isinstance(t, Operator):
-            n = 2 if t.arity is Arity.BINARY else 1
-            args = []
-            for i in range(n):
-                if not stack:
-                    raise ValueError("Insufficient arguments for operator: " + str(t))
-                args.append(stack.pop())
-            stack.append(t.f(*(args[::-1])))
+        elif k == _VARIABLE:
+            stack.append(variables[t.name])
+
+        elif k == _OPERATOR:
+            n = t.n_args
+            if len(stack) < n:
+                raise ValueError("Insufficient arguments for operator: " + str(t))
+            # the arguments are already in the correct order at the top of the stack
+            args = stack[-n:]
+            del stack[-n:]
+            stack.append((t.vf if vectorized else t.f)(*args))
 
         else:
             raise ValueError("Illegal token: " + str(t))
@@ -404,108 +427,5 @@ def _evaluate(rpn):
     return stack.pop()
 
 
-# TESTING
-
-def _get_prec(e):
-    for t in e:
-        if isinstance(t, Operator):
-            o1 = t
-    for t in e[::-1]:
-        if isinstance(t, Operator):
-            o2 = t
-    if o2.arity is Arity.BINARY and o1.arity is Arity.UNARY:
-        tmp = o1
-        o1 = o2
-        o2 = tmp
-    cmpsign = "<" if o1.precedence < o2.precedence else ">" if o1.precedence > o2.precedence else "="
-    return "prec(" + str(o1) + ") " + cmpsign + " prec(" + str(o2) + ")"
-
-
-print("Case 1: LAB + RAU")
-exp = (
-    ([Number(5), LAB0, RAU1, Number(1)], "5 1 - +"),
-    ([Number(5), LAB1, RAU1, Number(1)], "5 1 - +"),
-    ([Number(5), LAB1, RAU0, Number(1)], "5 1 - +"),
-    ([RAU1, Number(5), LAB0, Number(1)], "5 - 1 +"),
-    ([RAU1, Number(5), LAB1, Number(1)], "5 - 1 +"),
-    ([RAU0, Number(5), LAB1, Number(1)], "5 1 + -")
-)
-for e in exp:
-    print(_get_prec(e[0]), end=": ")
-    print(" ".join(str(val) for val in e[0]), end=" = ")
-    s = " ".join(str(val) for val in _shunting_yard(e[0]))
-    print(s + " =/= " + e[1] if s != e[1] else s)
-print()
-
-print("Case 2: LAB + LAU")
-exp = (
-    ([Number(5), LAU1, LAB0, Number(3)], "5 ! 3 +"),
-    ([Number(5), LAU1, LAB1, Number(3)], "5 ! 3 +"),
-    ([Number(5), LAU0, LAB1, Number(3)], "5 ! 3 +"),
-    ([Number(5), LAB0, Number(3), LAU1], "5 3 ! +"),
-    ([Number(5), LAB1, Number(3), LAU1], "5 3 + !"),
-    ([Number(5), LAB1, Number(3), LAU0], "5 3 + !"),
-)
-for e in exp:
-    print(_get_prec(e[0]), end=": ")
-    print(" ".join(str(val) for val in e[0]), end=" = ")
-    s = " ".join(str(val) for val in _shunting_yard(e[0]))
-    print(s + " =/= " + e[1] if s != e[1] else s)
-print()
-
-print("Case 3: RAB + RAU")
-exp = (
-    ([Number(5), RAB0, RAU1, Number(1)], "5 1 - **"),
-    ([Number(5), RAB1, RAU1, Number(1)], "5 1 - **"),
-    ([Number(5), RAB1, RAU0, Number(1)], "5 1 - **"),
-    ([RAU1, Number(5), RAB0, Number(1)], "5 - 1 **"),
-    ([RAU1, Number(5), RAB1, Number(1)], "5 1 ** -"),
-    ([RAU0, Number(5), RAB1, Number(1)], "5 1 ** -")
-)
-for e in exp:
-    print(_get_prec(e[0]), end=": ")
-    print(" ".join(str(val) for val in e[0]), end=" = ")
-    s = " ".join(str(val) for val in _shunting_yard(e[0]))
-    print(s + " =/= " + e[1] if s != e[1] else s)
-print()
-
-print("Case 4: RAB + LAU")
-exp = (
-    ([Number(5), LAU1, RAB0, Number(3)], "5 ! 3 **"),
-    ([Number(5), LAU1, RAB1, Number(3)], "5 ! 3 **"),
-    ([Number(5), LAU0, RAB1, Number(3)], "5 ! 3 **"),
-    ([Number(5), RAB0, Number(3), LAU1], "5 3 ! **"),
-    ([Number(5), RAB1, Number(3), LAU1], "5 3 ** !"),
-    ([Number(5), RAB1, Number(3), LAU0], "5 3 ** !")
-)
-for e in exp:
-    print(_get_prec(e[0]), end=": ")
-    print(" ".join(str(val) for val in e[0]), end=" = ")
-    s = " ".join(str(val) for val in _shunting_yard(e[0]))
-    print(s + " =/= " + e[1] if s != e[1] else s)
-print()
-
-print("Case 5: LAU + RAU")
-exp = (
-    ([RAU0, Number(5), LAU1], "5 ! -"),
-    ([RAU1, Number(5), LAU1], "5 - !"),
-    ([RAU1, Number(5), LAU0], "5 - !")
-)
-for e in exp:
-    print(_get_prec(e[0]), end=": ")
-    print(" ".join(str(val) for val in e[0]), end=" = ")
-    s = " ".join(str(val) for val in _shunting_yard(e[0]))
-    print(s + " =/= " + e[1] if s != e[1] else s)
-print()
-
-print(" ".join(str(val) for val in _shunting_yard([RAU0, Number(5), LAU0, LAB1, Number(3)])))
-print(" ".join(str(val) for val in _shunting_yard([RAU0, Number(5), LAU1, LAB0, Number(3)])))
-print(" ".join(str(val) for val in _shunting_yard([RAU0, Number(5), LAU1, LAB1, Number(3)])))
-print(" ".join(str(val) for val in _shunting_yard([RAU1, Number(5), LAU0, LAB0, Number(3)])))
-print(" ".join(str(val) for val in _shunting_yard([RAU1, Number(5), LAU0, LAB1, Number(3)])))
-print(" ".join(str(val) for val in _shunting_yard([RAU1, Number(5), LAU1, LAB0, Number(3)])))
-print(" ".join(str(val) for val in _shunting_yard([RAU1, Number(5), LAU1, LAB1, Number(3)])))
-print()
-
 if __name__ == '__main__':
     main()
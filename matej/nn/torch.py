@@ -5,10 +5,35 @@ import torchvision.transforms as tf
 
 # We subclass Sequential instead of Module to get some of the functionality (e.g. .cuda()) for free
 class Parallel(nn.Sequential):
-	""" The counterpart to :class:`~torch.nn.Sequential` that returns a tuple of the outputs of the modules. """
+	"""
+	The counterpart to :class:`~torch.nn.Sequential` that returns a tuple of the outputs of the modules.
+
+	With `cuda_streams=True`, each module runs on its own CUDA stream when the input is on a CUDA device,
+	so the kernels of several small modules (such as multi-task heads) can overlap on the GPU.
+	"""
+
+	def __init__(self, *args, cuda_streams=False):
+		super().__init__(*args)
+		self.cuda_streams = cuda_streams
+		self._streams = {}
 
 	def forward(self, x):
-		return tuple(module(x) for module in self)
+		if not (self.cuda_streams and x.is_cuda):
+			return tuple([module(x) for module in self])
+
+		streams = self._streams.get(x.device)
+		if streams is None or len(streams) != len(self):
+			streams = self._streams[x.device] = [torch.cuda.Stream(x.device) for _ in self]
+		current = torch.cuda.current_stream(x.device)
+		outputs = []
+		for module, stream in zip(self, streams):
+			stream.wait_stream(current)  # x must be ready before the module can use it
+			with torch.cuda.stream(stream):
+				outputs.append(module(x))
+		# Join back, so the caller's stream doesn't use the outputs before they're computed
+		for stream in streams:
+			current.wait_stream(stream)
+		return tuple(outputs)
 
 
 class NoneTransform:
@@ -6,18 +6,30 @@ module from Python's standard library.
 """
 
 from contextlib import suppress
-import itertools as it
+from functools import lru_cache
 from pathlib import Path
 from typing import *
 import winreg as reg
 
 
+# Full hive names and their shorthands mapped to the hive handles
+_HIVES = {name: getattr(reg, name) for name in dir(reg) if name.startswith('HKEY_')}
+_HIVES |= {
+	'HKCR': reg.HKEY_CLASSES_ROOT,
+	'HKLM': reg.HKEY_LOCAL_MACHINE,
+	'HKCU': reg.HKEY_CURRENT_USER,
+	'HKU': reg.HKEY_USERS,
+}
+
+
+@lru_cache(maxsize=256)
 def _parse(path):
 	hive, *path = Path(path).parts
-	shorthand = {'HKCR': 'HKEY_CLASSES_ROOT', 'HKLM': 'HKEY_LOCAL_MACHINE', 'HKCU': 'HKEY_CURRENT_USER', 'HKU': 'HKEY_USERS'}
-	if (hive := hive.upper()) in shorthand:
-		hive = shorthand[hive]
-	return getattr(reg, hive), Path(*path)
+	try:
+		hive = _HIVES[hive.upper()]
+	except KeyError:
+		raise ValueError(f"Unknown registry hive: {hive}") from None
+	return hive, Path(*path)
 
 
 def exists(key: Union[str, Path], value_name: Optional[str] = None) -> bool:
@@ -155,12 +167,18 @@ def delete_key(key: Union[str, Path], recursive: bool = False):
 		or could not be deleted for some other reason (such as permission errors).
 	"""
 
-	path = Path(key)
+	keys = [Path(key)]
 	if recursive:
-		for subkey in subkeys(path):
-			delete_key(Path(path)/subkey, True)
-	hive, path = _parse(path)
-	reg.DeleteKey(hive, str(path))
+		# Collect the whole tree first (opening each key once), then delete it children-first
+		stack = keys.copy()
+		while stack:
+			path = stack.pop()
+			subpaths = [path/subkey for subkey in subkeys(path)]
+			keys.extend(subpaths)
+			stack.extend(subpaths)
+	for path in reversed(keys):
+		hive, path = _parse(path)
+		reg.DeleteKey(hive, str(path))
 
 
 def subkeys(key: Union[str, Path]) -> Iterator[str]:
@@ -179,5 +197,6 @@ def subkeys(key: Union[str, Path]) -> Iterator[str]:
 
 	hive, path = _parse(key)
 	with suppress(OSError), reg.OpenKey(hive, str(path)) as key:
-		for i in it.count():
+		n_subkeys, _, _ = reg.QueryInfoKey(key)
+		for i in range(n_subkeys):
 			yield reg.EnumKey(key, i)
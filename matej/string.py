@@ -1,3 +1,4 @@
+from functools import lru_cache
 import re
 import string
 
@@ -10,12 +11,21 @@ SLOVENE_UPPER = SLOVENE_LOWER.upper()
 
 def multi_replace(s, replacements, ignore_case=False):
 	if ignore_case:
-		replacements = dict((k.lower(), v) for (k, v) in replacements.items())
-	rep = map(re.escape, sorted(replacements, key=len, reverse=True))
-	pattern = re.compile('|'.join(rep), re.I if ignore_case else 0)
+		replacements = {k.lower(): v for k, v in replacements.items()}
+		pattern = _replacement_pattern(frozenset(replacements), re.I)
+		return pattern.sub(lambda match: replacements[match.group(0).lower()], s)
+	# Character-wise replacements don't need a regex
+	if all(len(k) == 1 for k in replacements):
+		return s.translate(str.maketrans(replacements))
+	pattern = _replacement_pattern(frozenset(replacements))
 	return pattern.sub(lambda match: replacements[match.group(0)], s)
 
 
+@lru_cache(maxsize=128)
+def _replacement_pattern(keys, flags=0):
+	return re.compile('|'.join(map(re.escape, sorted(keys, key=len, reverse=True))), flags)
+
+
 def alphanum(s, allow_underscore=False):
 	return re.sub(r'[\W]+' if allow_underscore else r'[\W_]+', '', s)
 
@@ -0,0 +1,106 @@
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from matej.argparse import ArgParser
+
+
+class TestArgparse:
+	def test_path_arg(self):
+		ap = ArgParser()
+		ap.add_path_arg('-p', '--path-arg', default='', help="first path arg")
+		ap.add_path_arg(dest='second_path_arg', default='', help="second path arg")
+		assert ap.parse_args(['asdf']).second_path_arg == Path('asdf')
+		assert ap.parse_args(['-p', 'qwer']).path_arg == Path('qwer')
+		namespace = ap.parse_args(['asdf', '-p', 'qwer'])
+		assert namespace.path_arg == Path('qwer')
+		assert namespace.second_path_arg == Path('asdf')
+
+	def test_bool_arg(self):
+		ap = ArgParser()
+		ap.add_bool_arg('-t', '--true-arg', default=True, help="default true bool arg")
+		ap.add_bool_arg('-f', '--false-arg', default=False, help="default false bool arg")
+		assert ap.parse_args(['-t', 'True']).true_arg is True
+		assert ap.parse_args(['-t', 'False']).true_arg is False
+		assert ap.parse_args(['-t']).true_arg is False
+		assert ap.parse_args(['--true-arg']).true_arg is True
+		assert ap.parse_args(['--no-true-arg']).true_arg is False
+		assert ap.parse_args(['-f', 'False']).false_arg is False
+		assert ap.parse_args(['-f', 'True']).false_arg is True
+		assert ap.parse_args(['-f']).false_arg is True
+		assert ap.parse_args(['--false-arg']).false_arg is True
+		assert ap.parse_args(['--no-false-arg']).false_arg is False
+		# namespace = ap.parse_args(['-tf'])  # This one doesn't work
+		# assert namespace.true_arg is False
+		# assert namespace.false_arg is True
+
+	def test_choice_arg(self):
+		ap = ArgParser()
+		ap.add_choice_arg((1, 2, 3), '-c', '--choice-arg', default=1, help="default 1 choice arg")
+		ap.add_choice_arg(('b2t', 't2b'), '--method', choice_descriptions=("Bottom-to-top", "Top-to-bottom"), help="no default choice arg")
+		ap.add_choice_arg(('df', 'bf'), '--search', default='df', choice_descriptions=("Depth-first", "Breadth-first"), help="default depth-first choice arg")
+		assert ap.parse_args([]).choice_arg == 1
+		assert ap.parse_args(['-c', '2']).choice_arg == 2
+		with pytest.raises(SystemExit):
+			ap.parse_args(['-c', '4'])
+		assert ap.parse_args(['--method', 't2b']).method == 't2b'
+		assert ap.parse_args([]).method is None
+
+	def test_number_arg(self):
+		ap = ArgParser()
+		ap.add_number_arg('-m', '--number-arg', range=(0, 100.), nargs='+', help="number arg")
+		ap.add_number_arg('-n', '--number-arg2', min=0, default=40, help="default 40 number arg")
+		namespace = ap.parse_args([])
+		assert namespace.number_arg is None
+		assert namespace.number_arg2 == 40
+		assert ap.parse_args(['-m', '50']).number_arg == 50.
+		assert ap.parse_args(['-n', '610']).number_arg2 == 610
+		assert ap.parse_args(['-m', '50.5', '60', '70']).number_arg == [50.5, 60., 70.]
+		for args in (['-m', '101'], ['-m', '50', '101'], ['-n', '-1']):
+			with pytest.raises(SystemExit):
+				ap.parse_args(args)
+
+	def test_help(self, capsys):
+		ap = ArgParser()
+		ap.add_choice_arg(('df', 'bf'), '--search', default='df', choice_descriptions=("Depth-first", "Breadth-first"), help="default depth-first choice arg")
+		ap.add_number_arg('-n', '--number-arg', min=0, default=40, help="default 40 number arg")
+		with pytest.raises(SystemExit):
+			ap.parse_args(['-h'])
+		help = capsys.readouterr().out
+		assert "Depth-first <default>" in help
+		assert "[NUMBER_ARG >= 0]" in help
+
+	def test_store_dict(self):
+		ap = ArgParser()
+		ap.add_argument('--opts', action='store_dict')
+		assert ap.parse_args(['--opts', 'name=Alice', 'age=30', 'list', '[1, 2]']).opts == {'name': 'Alice', 'age': 30, 'list': [1, 2]}
+		assert ap.parse_args(['--opts', 'token=YQ==', 'none=None', 'text=(unclosed']).opts == {'token': 'YQ==', 'none': None, 'text': '(unclosed'}
+		assert ap.parse_args(['--opts', "raw=b'xy'", "r=r'\\d'", "u=u'x'", "rb=rb'z'", 'empty=set()', 'flag=True ', 'word=Trueish']).opts == {
+			'raw': b'xy', 'r': '\\d', 'u': 'x', 'rb': b'z', 'empty': set(), 'flag': True, 'word': 'Trueish',
+		}
+
+	def test_choice_type(self):
+		ap = ArgParser()
+		ap.add_choice_arg((1., 2.), '--whole')
+		ap.add_choice_arg((.5, 1), '--real')
+		ap.add_choice_arg(('1', '2'), '--numeric-str')
+		assert ap.parse_args(['--whole', '2']).whole == 2
+		assert ap.parse_args(['--real', '.5']).real == .5
+		assert ap.parse_args(['--numeric-str', '1']).numeric_str == '1'
+		with pytest.raises(TypeError):
+			ap.add_choice_arg((1, 'a'), '--mixed')
+
+	def test_choice_numeric_types(self):
+		ap = ArgParser()
+		ap.add_choice_arg(np.arange(3), '--np-int')
+		ap.add_choice_arg(np.array([.5, 1.5], dtype=np.float32), '--np-float')
+		ap.add_choice_arg((Fraction(1, 2), Fraction(3, 2)), '--fraction')
+		ap.add_choice_arg((Decimal(1), Decimal(2)), '--decimal')
+		namespace = ap.parse_args(['--np-int', '2', '--np-float', '1.5', '--fraction', '0.5', '--decimal', '2'])
+		assert namespace.np_int == 2
+		assert namespace.np_float == 1.5
+		assert namespace.fraction == Fraction(1, 2)
+		assert namespace.decimal == 2
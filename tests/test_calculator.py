@@ -0,0 +1,100 @@
+import math
+import operator as op
+
+import pytest
+
+from matej.math.calculator import Arity, Associativity, Number, Operator, _shunting_yard, calculate, compile_expression
+
+
+# Operators with the same symbol and associativity but different precedences (not registered with the calculator's operators)
+LAB0 = Operator('+', op.add, 0, group=[])
+LAB1 = Operator('+', op.add, 1, group=[])
+RAB0 = Operator('**', op.add, 0, Associativity.RIGHT, group=[])
+RAB1 = Operator('**', op.add, 1, Associativity.RIGHT, group=[])
+LAU0 = Operator('!', op.neg, 0, arity=Arity.UNARY, group=[])
+LAU1 = Operator('!', op.neg, 1, arity=Arity.UNARY, group=[])
+RAU0 = Operator('-', math.factorial, 0, Associativity.RIGHT, Arity.UNARY, group=[])
+RAU1 = Operator('-', math.factorial, 1, Associativity.RIGHT, Arity.UNARY, group=[])
+N5, N3, N1 = Number(5), Number(3), Number(1)
+
+
+def _rpn(tokens):
+	return " ".join(str(t) for t in _shunting_yard(tokens))
+
+
+# A binary operator with a higher precedence than an adjacent unary operator takes its operand from the wrong side
+_unary_binds_looser = pytest.mark.xfail(reason="unary operator with a lower precedence than the adjacent binary one", strict=True)
+
+
+class TestCalculator:
+	@pytest.mark.parametrize('tokens, rpn', [
+		# LAB + RAU
+		([N5, LAB0, RAU1, N1], "5 1 - +"),
+		([N5, LAB1, RAU1, N1], "5 1 - +"),
+		pytest.param([N5, LAB1, RAU0, N1], "5 1 - +", marks=_unary_binds_looser),
+		([RAU1, N5, LAB0, N1], "5 - 1 +"),
+		([RAU1, N5, LAB1, N1], "5 - 1 +"),
+		([RAU0, N5, LAB1, N1], "5 1 + -"),
+		# LAB + LAU
+		([N5, LAU1, LAB0, N3], "5 ! 3 +"),
+		([N5, LAU1, LAB1, N3], "5 ! 3 +"),
+		pytest.param([N5, LAU0, LAB1, N3], "5 ! 3 +", marks=_unary_binds_looser),
+		([N5, LAB0, N3, LAU1], "5 3 ! +"),
+		([N5, LAB1, N3, LAU1], "5 3 + !"),
+		([N5, LAB1, N3, LAU0], "5 3 + !"),
+		# RAB + RAU
+		([N5, RAB0, RAU1, N1], "5 1 - **"),
+		([N5, RAB1, RAU1, N1], "5 1 - **"),
+		pytest.param([N5, RAB1, RAU0, N1], "5 1 - **", marks=_unary_binds_looser),
+		([RAU1, N5, RAB0, N1], "5 - 1 **"),
+		([RAU1, N5, RAB1, N1], "5 1 ** -"),
+		([RAU0, N5, RAB1, N1], "5 1 ** -"),
+		# RAB + LAU
+		([N5, LAU1, RAB0, N3], "5 ! 3 **"),
+		pytest.param([N5, LAU1, RAB1, N3], "5 ! 3 **", marks=_unary_binds_looser),
+		pytest.param([N5, LAU0, RAB1, N3], "5 ! 3 **", marks=_unary_binds_looser),
+		([N5, RAB0, N3, LAU1], "5 3 ! **"),
+		([N5, RAB1, N3, LAU1], "5 3 ** !"),
+		([N5, RAB1, N3, LAU0], "5 3 ** !"),
+		# LAU + RAU
+		([RAU0, N5, LAU1], "5 ! -"),
+		([RAU1, N5, LAU1], "5 - !"),
+		([RAU1, N5, LAU0], "5 - !"),
+		# Mixed
+		([RAU0, N5, LAU0, LAB1, N3], "5 - 3 + !"),
+		([RAU0, N5, LAU1, LAB0, N3], "5 ! - 3 +"),
+		([RAU0, N5, LAU1, LAB1, N3], "5 ! 3 + -"),
+		([RAU1, N5, LAU0, LAB0, N3], "5 - ! 3 +"),
+		([RAU1, N5, LAU0, LAB1, N3], "5 - 3 + !"),
+		([RAU1, N5, LAU1, LAB0, N3], "5 - ! 3 +"),
+		([RAU1, N5, LAU1, LAB1, N3], "5 - ! 3 +"),
+	])
+	def test_shunting_yard(self, tokens, rpn):
+		assert _rpn(tokens) == rpn
+
+	def test_number_literals(self):
+		assert calculate('2.5') == 2.5
+		assert calculate('1.') == 1
+		assert calculate('1.+2') == 3
+		assert calculate('.5') == .5
+		assert calculate('1.e3') == 1000
+		assert calculate('.5e1') == 5
+		assert calculate('01.5') == 1.5
+		assert calculate('0x1F') == 31
+		assert calculate('0b101') == 5
+		assert calculate('017') == calculate('0o17') == 15
+
+	def test_unicode_digits(self):
+		assert calculate('٣٤+1') == 35
+		assert calculate('٣.٥') == 3.5
+
+	def test_illegal_numbers(self):
+		with pytest.raises(ValueError):
+			calculate('1.5.3')
+
+	def test_compile_expression(self):
+		f = compile_expression('x + y', 'x', 'y')
+		assert f(1, 2) == 3
+		for values in ((1,), (1, 2, 3)):
+			with pytest.raises(TypeError, match="x, y"):
+				f(*values)
@@ -0,0 +1,53 @@
+import functools as ft
+
+from matej.callable import partial, partialmethod, varargs
+
+
+class TestCallable:
+	def test_varargs(self):
+		@varargs
+		def test(*arglist, kwarg=None):
+			return arglist, kwarg
+
+		assert test([1, 2, 3]) == ((1, 2, 3), None)
+		assert test(1, 2, 3) == ((1, 2, 3), None)
+
+		@varargs
+		def test2(arg, *arglist, kwarg=None):
+			return arg, arglist, kwarg
+
+		assert test2([1, 2, 3], [4, 5, 6]) == ([1, 2, 3], ([4, 5, 6],), None)
+		assert test2(1, 2, 3, 4, 5, 6) == (1, (2, 3, 4, 5, 6), None)
+		assert test2([1, 2, 3]) == (1, (2, 3), None)
+
+	def test_partialmethod(self):
+		class C:
+			def f(self, a, b, c=0):
+				return self, a, b, c
+
+			@classmethod
+			def g(cls, a, b):
+				return cls, a, b
+
+			f1 = partialmethod(f, ..., 2, c=3)
+			f2 = partialmethod(f, 1)
+			g1 = partialmethod(g, ..., 2)
+
+		c = C()
+		assert c.f1(1) == (c, 1, 2, 3)
+		assert c.f2(2, c=4) == (c, 1, 2, 4)
+		assert C.f1(c, 1) == (c, 1, 2, 3)
+		assert C.g1(1) == (C, 1, 2)
+		assert c.g1(1) == (C, 1, 2)
+
+	def test_partialmethod_of_partial(self):
+		def f(self, a, b):
+			return self, a, b
+
+		class C:
+			ours = partialmethod(partial(f, b=2))
+			stdlib = ft.partialmethod(ft.partial(f, b=2))
+
+		c = C()
+		assert c.ours(1) == c.stdlib(1) == (c, 1, 2)
+		assert C.ours(c, 1) == C.stdlib(c, 1) == (c, 1, 2)
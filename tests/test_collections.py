@@ -37,6 +37,8 @@ class TestCollections:
 		assert l != old_l
 		assert type(l) is list
 		assert type(mc.shuffled((1, 2, 3))) is tuple
+		assert mc.shuffled({1, 2, 3}) == {1, 2, 3}
+		assert sorted(mc.shuffled(x for x in range(3))) == [0, 1, 2]
 
 	def test_flatten(self):
 		assert list(mc.flatten([[[1, 2], 3], 4, 5, [6, [7, 8]]])) == [1, 2, 3, 4, 5, 6, 7, 8]
@@ -45,6 +47,40 @@ class TestCollections:
 		assert list(mc.flatten([[1, 2], {3: 'a', 4: 'b'}])) == [1, 2, 3, 4]
 		assert list(mc.flatten([[1, 2], {3: 'a', 4: 'b'}], flatten_dicts=False)) == [1, 2, {3: 'a', 4: 'b'}]
 		assert list(mc.flatten([[1, 2], (x for x in range(3))])) == [1, 2, 0, 1, 2]
+		assert list(mc.flatten([['ab'], (x for x in ('c', 'de'))], flatten_strings=True)) == ['a', 'b', 'c', 'd', 'e']
 		l = list(mc.flatten([[1, 2], (x for x in range(3))], flatten_generators=False))
 		assert l[:2] == [1, 2]
-		assert type(l[2]) == type((x for x in range(3)))
\ No newline at end of file
+		assert type(l[2]) == type((x for x in range(3)))
+
+	def test_dotdict(self):
+		d = mc.DotDict({'a': {'b': {'c': 1}}, 'l': [{'x': 1}]}, k={'v': 2})
+		assert d.a.b.c == 1
+		assert d.k.v == 2
+		assert type(d.a.b) is mc.DotDict
+		assert type(d.l[0]) is dict
+		d.n = 3
+		assert d['n'] == 3
+		del d.n
+		assert 'n' not in d
+
+	def test_sparse_grid_within(self):
+		grid = mc.SparseGrid()
+		grid[0, 0] = 'a'
+		grid[2, 2] = 'b'
+		grid[5, 5] = 'c'
+		assert list(grid.within((0, 0), (2, 2))) == [((0, 0), 'a'), ((2, 2), 'b')]
+		grid[2, 2] = 'd'
+		assert list(grid.within((1, 1), (5, 5))) == [((2, 2), 'd'), ((5, 5), 'c')]
+		grid.sort(key=lambda item: -sum(item[0]))
+		assert list(grid.within((0, 0), (5, 5))) == [((5, 5), 'c'), ((2, 2), 'd'), ((0, 0), 'a')]
+		del grid[5, 5]
+		assert list(grid.within((0, 0), (5, 5))) == [((2, 2), 'd'), ((0, 0), 'a')]
+
+		multigrid = mc.SparseMultiGrid()
+		multigrid.add((3, 3), 'x')
+		multigrid.add((0, 0), 'y')
+		assert list(multigrid.within((0, 0), (3, 3))) == [((3, 3), ['x']), ((0, 0), ['y'])]
+		assert multigrid[1, 1] == []  # Inserts an empty cell
+		assert list(multigrid.within((0, 0), (3, 3))) == [((3, 3), ['x']), ((0, 0), ['y']), ((1, 1), [])]
+		multigrid.sort()
+		assert list(multigrid.within((0, 0), (3, 3))) == [((0, 0), ['y']), ((1, 1), []), ((3, 3), ['x'])]
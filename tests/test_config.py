@@ -0,0 +1,44 @@
+from collections import deque
+
+import numpy as np
+
+from matej.config import Config
+
+
+class TestConfig:
+	def test_nested_init(self):
+		config = Config({'a': {'b': [{'c': 1}, ({'d': 2},)]}, 'e': deque([{'f': 3}])})
+		assert isinstance(config.a, Config)
+		assert isinstance(config.a.b[0], Config) and config.a.b[0].c == 1
+		assert type(config.a.b[1]) is tuple and config.a.b[1][0].d == 2
+		assert type(config.e) is deque and config.e[0].f == 3
+
+		deep = d = {}
+		for _ in range(3000):
+			d['x'] = d = {}
+		config = Config(deep)
+		for _ in range(3000):
+			config = config.x
+		assert config == Config()
+
+	def test_nested_copies(self):
+		inner = Config(x=1)
+		outer = Config(a=inner)
+		assert outer.a is not inner
+		outer.a.x = 2
+		assert inner.x == 1
+
+	def test_other_iterables(self):
+		array = np.array([1, 2, 3])
+		config = Config(a=array)
+		assert config.a is array
+
+	def test_subclass_init(self):
+		class SubConfig(Config):
+			def __init__(self, d=None, /, **kw):
+				super().__init__(d, **kw)
+				self.__dict__['initialised'] = True
+
+		config = SubConfig({'a': {'b': {'c': 1}}, 'l': [{'d': 2}]})
+		assert config.initialised and config.a.initialised and config.a.b.initialised
+		assert type(config.l[0]) is SubConfig and config.l[0].initialised
@@ -0,0 +1,21 @@
+import numpy as np
+
+from matej.math import RunningStats
+
+
+class TestRunningStats:
+	def test_cache_copies_batch(self):
+		buf = np.ones((2, 3))
+		stats = RunningStats()
+		stats.update(buf)
+		buf[:] = 7
+		assert np.array_equal(stats.last(), [1, 1, 1])
+		assert all(np.array_equal(row, [1, 1, 1]) for row in stats.last('all'))
+
+	def test_latex(self):
+		assert RunningStats("a", [1, 2, 3]).latex(precision=2) == r"a & $2. \pm 0.82$"
+		assert RunningStats("b", [2, 2]).latex(include_name=False) == "$2.$"
+
+	def test_latex_vector(self):
+		stats = RunningStats("v", [[1, 2], [3, 2]])
+		assert stats.latex() == r"v & $2. \pm 1.$ & $2.$"